@@ -1,14 +1,26 @@
 import ast
+import asyncio
 import concurrent.futures
+import contextvars
+import copy
+import functools
+import importlib.util
 import json
 import logging
 import os
+import threading
+import time
 from typing import Any, Optional, Union
 
-import requests
+import httpx
 import yaml
 from tqdm import tqdm
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from embedchain.cache import (
     Config,
     ExactMatchEvaluation,
@@ -20,7 +32,7 @@ from embedchain.cache import (
 from embedchain.client import Client
 from embedchain.config import AppConfig, CacheConfig, ChunkerConfig, Mem0Config
 from embedchain.core.db.database import get_session
-from embedchain.core.db.models import DataSource
+from embedchain.core.db.models import DataSource, UploadedContent
 from embedchain.embedchain import EmbedChain
 from embedchain.embedder.base import BaseEmbedder
 from embedchain.embedder.openai import OpenAIEmbedder
@@ -32,6 +44,7 @@ from embedchain.evaluation.metrics import (
 )
 from embedchain.factory import EmbedderFactory, LlmFactory, VectorDBFactory
 from embedchain.helpers.json_serializable import register_deserializable
+from embedchain.helpers.lru_cache import LRUCache
 from embedchain.llm.base import BaseLlm
 from embedchain.llm.openai import OpenAILlm
 from embedchain.telemetry.posthog import AnonymousTelemetry
@@ -43,6 +56,114 @@ from mem0 import Memory
 
 logger = logging.getLogger(__name__)
 
+# Prefer the libyaml based C loader, PyYAML's pure-Python loader is several times slower
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# HTTP/2 lets concurrent deploy requests share one connection, it needs the optional `h2` package
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+class _RetryTransport(httpx.BaseTransport):
+    """
+    Retry idempotent requests that fail with a 502, 503 or 504 status, with exponential backoff.
+    Connection failures are already retried by the wrapped transport. Request bodies must be
+    replayable, which is why file uploads are sent as a `_FileContent`.
+    """
+
+    RETRY_STATUS_CODES = (502, 503, 504)
+    # Same methods as urllib3's `Retry`, a failed POST may still have been processed by the platform
+    RETRY_METHODS = ("DELETE", "GET", "HEAD", "OPTIONS", "PUT", "TRACE")
+
+    def __init__(self, transport: httpx.BaseTransport, retries: int = 3, backoff_factor: float = 0.2):
+        self._transport = transport
+        self._retries = retries
+        self._backoff_factor = backoff_factor
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        response = self._transport.handle_request(request)
+        if request.method not in self.RETRY_METHODS:
+            return response
+        for attempt in range(self._retries):
+            if response.status_code not in self.RETRY_STATUS_CODES:
+                break
+            response.close()
+            time.sleep(self._backoff_factor * 2**attempt)
+            response = self._transport.handle_request(request)
+        return response
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class _FileContent:
+    """
+    Stream a file as a request body. Unlike a plain file object it is read from the start on
+    every iteration, so `_RetryTransport` can send it again.
+    """
+
+    CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, file):
+        self._file = file
+
+    def __iter__(self):
+        self._file.seek(0)
+        while chunk := self._file.read(self.CHUNK_SIZE):
+            yield chunk
+
+
+def _load_qna_pair(data_value: str) -> list:
+    """Parse a stored `qna_pair` source, which is JSON or a python literal for older rows."""
+    try:
+        return list(orjson.loads(data_value) if orjson is not None else json.loads(data_value))
+    except ValueError:
+        return list(ast.literal_eval(data_value))
+
+
+# Seconds for which a presigned url handed out by the platform stays valid
+PRESIGNED_URL_EXPIRY = 3600
+
+# The config dict `App.from_config` has already validated, so `App.__init__` does not validate it twice
+_validated_config_data: contextvars.ContextVar[Optional[dict]] = contextvars.ContextVar(
+    "validated_config_data", default=None
+)
+
+# Platform clients shared by all apps, keyed by API key, see `App._init_client`
+_CLIENTS: dict[str, Client] = {}
+_CLIENT_LOCK = threading.Lock()
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_config_file(config_path: str, mtime_ns: int, size: int) -> dict:
+    # `mtime_ns` and `size` are only part of the cache key, so an edited file is parsed again
+    file_extension = os.path.splitext(config_path)[1]
+    if file_extension in [".yaml", ".yml"]:
+        with open(config_path, "r", encoding="UTF-8") as file:
+            return yaml.load(file, Loader=YAML_LOADER)
+    elif file_extension == ".json":
+        if orjson is not None:
+            with open(config_path, "rb") as file:
+                return orjson.loads(file.read())
+        with open(config_path, "r", encoding="UTF-8") as file:
+            return json.load(file)
+    else:
+        raise ValueError("config_path must be a path to a YAML or JSON file.")
+
+
+def load_config_file(config_path: str) -> dict:
+    """
+    Load a YAML or JSON config file. Parsed files are cached until they are modified.
+
+    :param config_path: Path to the YAML or JSON configuration file.
+    :type config_path: str
+    :return: The parsed configuration.
+    :rtype: dict
+    """
+    config_path = os.path.abspath(config_path)
+    stat = os.stat(config_path)
+    # Callers may modify the returned config, never hand out the cached dict
+    return copy.deepcopy(_parse_config_file(config_path, stat.st_mtime_ns, stat.st_size))
+
 
 @register_deserializable
 class App(EmbedChain):
@@ -84,19 +205,29 @@ class App(EmbedChain):
         :type auto_deploy: bool, optional
         :raises Exception: If an error occurs while creating the pipeline
         """
-        if id and config_data:
-            raise Exception("Cannot provide both id and config. Please provide only one of them.")
-
-        if id and name:
-            raise Exception("Cannot provide both id and name. Please provide only one of them.")
-
-        if name and config:
-            raise Exception("Cannot provide both name and config. Please provide only one of them.")
+        exclusive_args = (("id", id, "config", config_data), ("id", id, "name", name), ("name", name, "config", config))
+        for first_name, first, second_name, second in exclusive_args:
+            if first and second:
+                raise Exception(f"Cannot provide both {first_name} and {second_name}. Please provide only one of them.")
 
         self.auto_deploy = auto_deploy
         # Store the dict config as an attribute to be able to send it
-        self.config_data = config_data if (config_data and validate_config(config_data)) else None
+        if config_data and (config_data is _validated_config_data.get() or validate_config(config_data)):
+            self.config_data = config_data
+        else:
+            self.config_data = None
         self.client = None
+        # Pooled HTTP client for the platform API, created alongside the client
+        self._http_client = None
+        # The metadata db session is not thread-safe, guard writes made by concurrent uploads
+        self._db_lock = threading.Lock()
+        # The batch endpoint is speculative, this is flipped off the first time the platform answers it with a 404 or
+        # 405. Only used when the experimental `AppConfig.upload_batch_size` is set.
+        self._batch_add_supported = True
+        # Hashes of data sources uploaded during the current deploy, see `_flush_uploaded`
+        self._uploaded_buffer = []
+        # Files uploaded to a presigned url during the current deploy, see `_flush_uploaded`
+        self._uploaded_content_buffer = []
         # pipeline_id from the backend
         self.id = None
         self.chunker = ChunkerConfig(**chunker) if chunker else None
@@ -123,6 +254,9 @@ class App(EmbedChain):
         self.llm = llm or OpenAILlm()
         self._init_db()
 
+        search_cache_ttl = getattr(self.config, "search_cache_ttl", None)
+        self._search_cache = LRUCache(maxsize=1024, ttl=search_cache_ttl) if search_cache_ttl else None
+
         # Session for the metadata db
         self.db_session = get_session()
 
@@ -171,16 +305,52 @@ class App(EmbedChain):
 
     def _init_client(self):
         """
-        Initialize the client.
+        Initialize the client, reusing the one of any app that uses the same API key.
         """
-        config = Client.load_config()
-        if config.get("api_key"):
-            self.client = Client()
-        else:
-            api_key = input(
-                "🔑 Enter your Embedchain API key. You can find the API key at https://app.embedchain.ai/settings/keys/ \n"  # noqa: E501
-            )
-            self.client = Client(api_key=api_key)
+        with _CLIENT_LOCK:
+            # The stored key may have been replaced since the last deploy, reading it is cached by mtime
+            api_key = Client.load_config().get("api_key")
+            if api_key:
+                if api_key not in _CLIENTS:
+                    _CLIENTS[api_key] = Client()
+            else:
+                api_key = input(
+                    "🔑 Enter your Embedchain API key. You can find the API key at https://app.embedchain.ai/settings/keys/ \n"  # noqa: E501
+                )
+                _CLIENTS[api_key] = Client(api_key=api_key)
+            self.client = _CLIENTS[api_key]
+        if self._http_client is None:
+            self._init_http_client()
+
+    def _get_auth_headers(self):
+        return {"Authorization": f"Token {self.client.api_key}"}
+
+    def _init_http_client(self):
+        """
+        Initialize a persistent HTTP client for the platform API so that deploy
+        reuses connections instead of opening a new one per request.
+        """
+        if self._http_client is not None:
+            self._http_client.close()
+        self._http_client = httpx.Client(
+            transport=_RetryTransport(
+                httpx.HTTPTransport(
+                    http2=HTTP2_AVAILABLE,
+                    retries=3,
+                    limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+                )
+            ),
+            # A single stuck upload must not stall the other requests sharing the connection
+            timeout=httpx.Timeout(60.0, connect=5.0),
+        )
+
+    def close(self):
+        """
+        Close the HTTP client used to talk to the platform.
+        """
+        if self._http_client is not None:
+            self._http_client.close()
+            self._http_client = None
 
     def _get_pipeline(self, id):
         """
@@ -188,10 +358,7 @@ class App(EmbedChain):
         """
         print("🛠️ Fetching pipeline details from the platform...")
         url = f"{self.client.host}/api/v1/pipelines/{id}/cli/"
-        r = requests.get(
-            url,
-            headers={"Authorization": f"Token {self.client.api_key}"},
-        )
+        r = self._http_client.get(url, headers=self._get_auth_headers())
         if r.status_code == 404:
             raise Exception(f"❌ Pipeline with id {id} not found!")
 
@@ -205,18 +372,20 @@ class App(EmbedChain):
         Create a pipeline on the platform.
         """
         print("🛠️ Creating pipeline on the platform...")
+        url = f"{self.client.host}/api/v1/pipelines/cli/create/"
+        r = self._http_client.post(url, json=self._get_create_pipeline_payload(), headers=self._get_auth_headers())
+        return self._handle_create_pipeline_response(r)
+
+    def _get_create_pipeline_payload(self):
         # self.config_data is a dict. Pass it inside the key 'yaml_config' to the backend
-        payload = {
+        return {
             "yaml_config": json.dumps(self.config_data),
             "name": self.name,
             "local_id": self.local_id,
         }
-        url = f"{self.client.host}/api/v1/pipelines/cli/create/"
-        r = requests.post(
-            url,
-            json=payload,
-            headers={"Authorization": f"Token {self.client.api_key}"},
-        )
+
+    @staticmethod
+    def _handle_create_pipeline_response(r):
         if r.status_code not in [200, 201]:
             raise Exception(f"❌ Error occurred while creating pipeline. API response: {r.text}")
 
@@ -232,10 +401,10 @@ class App(EmbedChain):
 
     def _get_presigned_url(self, data_type, data_value):
         payload = {"data_type": data_type, "data_value": data_value}
-        r = requests.post(
+        r = self._http_client.post(
             f"{self.client.host}/api/v1/pipelines/{self.id}/cli/presigned_url/",
             json=payload,
-            headers={"Authorization": f"Token {self.client.api_key}"},
+            headers=self._get_auth_headers(),
         )
         r.raise_for_status()
         return r.json()
@@ -243,7 +412,13 @@ class App(EmbedChain):
     def _upload_file_to_presigned_url(self, presigned_url, file_path):
         try:
             with open(file_path, "rb") as file:
-                response = requests.put(presigned_url, data=file)
+                # Presigned URLs carry their own auth, so the platform token is not sent. An explicit
+                # Content-Length lets the file be streamed instead of buffered in memory.
+                headers = {
+                    "Content-Length": str(os.fstat(file.fileno()).st_size),
+                    "Content-Type": "application/octet-stream",
+                }
+                response = self._http_client.put(presigned_url, content=_FileContent(file), headers=headers)
                 response.raise_for_status()
                 return response.status_code == 200
         except Exception as e:
@@ -259,45 +434,158 @@ class App(EmbedChain):
         }
         try:
             self._send_api_request(f"/api/v1/pipelines/{self.id}/cli/add/", payload)
-            # print the local file path if user tries to upload a local file
-            printed_value = metadata.get("file_path") if metadata.get("file_path") else data_value
-            print(f"✅ Data of type: {data_type}, value: {printed_value} added successfully.")
+            self._print_data_uploaded(data_type, data_value, metadata)
         except Exception as e:
             print(f"❌ Error occurred during data upload for type {data_type}!. Error: {str(e)}")
 
+    @staticmethod
+    def _print_data_uploaded(data_type, data_value, metadata):
+        # print the local file path if user tries to upload a local file
+        printed_value = metadata.get("file_path") if metadata.get("file_path") else data_value
+        print(f"✅ Data of type: {data_type}, value: {printed_value} added successfully.")
+
     def _send_api_request(self, endpoint, payload):
         url = f"{self.client.host}{endpoint}"
-        headers = {"Authorization": f"Token {self.client.api_key}"}
-        response = requests.post(url, json=payload, headers=headers)
+        response = self._http_client.post(url, json=payload, headers=self._get_auth_headers())
         response.raise_for_status()
         return response
 
-    def _process_and_upload_data(self, data_hash, data_type, data_value):
+    def _batch_upload_data_to_pipeline(self, items, executor):
+        """
+        Add several data sources to the pipeline with a single request. Experimental, the
+        `/cli/add/batch/` endpoint is not documented by the platform. Falls back to one
+        request per item, run on `executor`, when the platform does not support it.
+
+        :param items: Items as returned by `_prepare_data_for_upload`
+        :type items: list[dict]
+        :param executor: Executor running the per-item fallback requests
+        :type executor: concurrent.futures.Executor
+        """
+        if not items:
+            return
+
+        if self._batch_add_supported:
+            payload = {
+                "items": [
+                    {"data_type": item["data_type"], "data_value": item["data_value"], "metadata": item["metadata"]}
+                    for item in items
+                ]
+            }
+            try:
+                self._send_api_request(f"/api/v1/pipelines/{self.id}/cli/add/batch/", payload)
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code not in [404, 405]:
+                    print(f"❌ Error occurred during batch data upload!. Error: {str(e)}")
+                    return
+                logger.info("Batched data upload is not supported by the platform, uploading one by one.")
+                self._batch_add_supported = False
+            else:
+                for item in items:
+                    self._print_data_uploaded(item["data_type"], item["data_value"], item["metadata"])
+                    self._mark_data_as_uploaded(item["data_hash"])
+                return
+
+        list(executor.map(self._upload_prepared_data, items))
+
+    def _upload_prepared_data(self, item):
+        if item is None:
+            return
+        self._upload_data_to_pipeline(item["data_type"], item["data_value"], item["metadata"])
+        self._mark_data_as_uploaded(item["data_hash"])
+
+    def _prepare_data_for_upload(self, data_hash, data_type, data_value):
+        """
+        Upload local files to their presigned url and build the payload for adding
+        the data source to the pipeline. Returns None if the file upload failed.
+        """
         if os.path.isabs(data_value):
-            presigned_url_data = self._get_presigned_url(data_type, data_value)
-            presigned_url = presigned_url_data["presigned_url"]
-            s3_key = presigned_url_data["s3_key"]
-            if self._upload_file_to_presigned_url(presigned_url, file_path=data_value):
-                metadata = {"file_path": data_value, "s3_key": s3_key}
-                data_value = presigned_url
+            uploaded = self._get_uploaded_content(data_hash, data_value)
+            if uploaded is not None:
+                s3_key, presigned_url = uploaded
             else:
-                logger.error(f"File upload failed for hash: {data_hash}")
-                return False
+                presigned_url_data = self._get_presigned_url(data_type, data_value)
+                presigned_url = presigned_url_data["presigned_url"]
+                s3_key = presigned_url_data["s3_key"]
+                if not self._upload_file_to_presigned_url(presigned_url, file_path=data_value):
+                    logger.error(f"File upload failed for hash: {data_hash}")
+                    return None
+                self._mark_content_as_uploaded(data_hash, s3_key, presigned_url)
+            metadata = {"file_path": data_value, "s3_key": s3_key}
+            data_value = presigned_url
         else:
             if data_type == "qna_pair":
-                data_value = list(ast.literal_eval(data_value))
+                data_value = _load_qna_pair(data_value)
             metadata = {}
 
-        try:
-            self._upload_data_to_pipeline(data_type, data_value, metadata)
-            self._mark_data_as_uploaded(data_hash)
-            return True
-        except Exception:
-            print(f"❌ Error occurred during data upload for hash {data_hash}!")
-            return False
+        return {"data_hash": data_hash, "data_type": data_type, "data_value": data_value, "metadata": metadata}
 
     def _mark_data_as_uploaded(self, data_hash):
-        self.db_session.query(DataSource).filter_by(hash=data_hash, app_id=self.local_id).update({"is_uploaded": 1})
+        # Buffered and written in bulk by `_flush_uploaded` once the deploy finishes
+        with self._db_lock:
+            self._uploaded_buffer.append(data_hash)
+
+    def _get_uploaded_content(self, data_hash, file_path):
+        """
+        Look up a file that was already uploaded to this pipeline by an earlier deploy that did not finish.
+        Returns its `(s3_key, presigned_url)`, or None if it has to be uploaded.
+        """
+        with self._db_lock:
+            row = (
+                self.db_session.query(
+                    UploadedContent.s3_key, UploadedContent.presigned_url, UploadedContent.uploaded_at
+                )
+                .filter(UploadedContent.hash == data_hash, UploadedContent.pipeline_id == self.id)
+                .first()
+            )
+        if row is None:
+            return None
+        s3_key, presigned_url, uploaded_at = row
+        # Leave some headroom so the url does not expire while the platform fetches it
+        if time.time() - uploaded_at > PRESIGNED_URL_EXPIRY / 2:
+            return None
+        try:
+            # The hash of a local file is computed from its path, so a file changed since its upload is stale
+            if os.path.getmtime(file_path) > uploaded_at:
+                return None
+        except OSError:
+            # Moved or deleted since its upload, let the regular upload path report it
+            return None
+        return s3_key, presigned_url
+
+    def _mark_content_as_uploaded(self, data_hash, s3_key, presigned_url):
+        # Buffered and written by `_flush_uploaded` in the same commit as the data sources
+        with self._db_lock:
+            self._uploaded_content_buffer.append(
+                UploadedContent(
+                    hash=data_hash,
+                    pipeline_id=self.id,
+                    s3_key=s3_key,
+                    presigned_url=presigned_url,
+                    uploaded_at=int(time.time()),
+                )
+            )
+
+    def _flush_uploaded(self, chunk_size=500):
+        """
+        Mark all buffered data sources and uploaded files as uploaded with a single commit.
+        """
+        with self._db_lock:
+            hashes, self._uploaded_buffer = self._uploaded_buffer, []
+            contents, self._uploaded_content_buffer = self._uploaded_content_buffer, []
+            if not hashes and not contents:
+                return
+            try:
+                for i in range(0, len(hashes), chunk_size):
+                    self.db_session.query(DataSource).filter(
+                        DataSource.app_id == self.local_id, DataSource.hash.in_(hashes[i : i + chunk_size])
+                    ).update({"is_uploaded": 1}, synchronize_session=False)
+                for content in contents:
+                    # Insert or replace, the same file may be uploaded again after it changed
+                    self.db_session.merge(content)
+                self.db_session.commit()
+            except Exception as e:
+                logger.error(f"Error marking data sources as uploaded: {e}")
+                self.db_session.rollback()
 
     def get_data_sources(self):
         data_sources = self.db_session.query(DataSource).filter_by(app_id=self.local_id).all()
@@ -306,23 +594,123 @@ class App(EmbedChain):
             results.append({"data_type": row.type, "data_value": row.value, "metadata": row.meta_data})
         return results
 
+    def _get_pending_data_sources(self):
+        # Only load the columns needed for the upload, as plain tuples that are safe to hand to worker threads
+        results = (
+            self.db_session.query(DataSource.hash, DataSource.type, DataSource.value)
+            .filter_by(app_id=self.local_id, is_uploaded=0)
+            .all()
+        )
+        return [tuple(result) for result in results]
+
+    def _get_deploy_max_workers(self, num_pending):
+        return min(getattr(self.config, "deploy_max_workers", 16), num_pending)
+
     def deploy(self):
-        if self.client is None:
-            self._init_client()
+        self._init_client()
 
         pipeline_data = self._create_pipeline()
         self.id = pipeline_data["id"]
 
-        results = self.db_session.query(DataSource).filter_by(app_id=self.local_id, is_uploaded=0).all()
-        if len(results) > 0:
+        pending = self._get_pending_data_sources()
+        if len(pending) > 0:
             print("🛠️ Adding data to your pipeline...")
-        for result in results:
-            data_hash, data_type, data_value = result.hash, result.data_type, result.data_value
-            self._process_and_upload_data(data_hash, data_type, data_value)
+            batch_size = getattr(self.config, "upload_batch_size", None)
+            try:
+                with concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self._get_deploy_max_workers(len(pending))
+                ) as executor:
+                    if batch_size:
+                        for i in range(0, len(pending), batch_size):
+                            # Upload the files of a batch concurrently, then add the whole batch in one request
+                            items = executor.map(
+                                lambda row: self._prepare_data_for_upload(*row), pending[i : i + batch_size]
+                            )
+                            self._batch_upload_data_to_pipeline([item for item in items if item is not None], executor)
+                    else:
+                        list(
+                            executor.map(
+                                lambda row: self._upload_prepared_data(self._prepare_data_for_upload(*row)), pending
+                            )
+                        )
+            finally:
+                self._flush_uploaded()
 
         # Send anonymous telemetry
         self.telemetry.capture(event_name="deploy", properties=self._telemetry_props)
 
+    async def adeploy(self):
+        """
+        Deploy the app to the platform without blocking the event loop.
+
+        Data additions for all pending data sources are overlapped on a single
+        `httpx.AsyncClient`, while presigned URL requests and file uploads run in
+        worker threads. Both are bounded by `AppConfig.deploy_max_workers`.
+        """
+        self._init_client()
+
+        async with httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_connections=64),
+            timeout=httpx.Timeout(60.0, connect=5.0),
+        ) as http_client:
+            print("🛠️ Creating pipeline on the platform...")
+            r = await http_client.post(
+                f"{self.client.host}/api/v1/pipelines/cli/create/",
+                json=self._get_create_pipeline_payload(),
+                headers=self._get_auth_headers(),
+            )
+            pipeline_data = self._handle_create_pipeline_response(r)
+            self.id = pipeline_data["id"]
+
+            pending = await asyncio.to_thread(self._get_pending_data_sources)
+            if len(pending) > 0:
+                print("🛠️ Adding data to your pipeline...")
+                semaphore = asyncio.Semaphore(self._get_deploy_max_workers(len(pending)))
+
+                async def _bounded_upload(row):
+                    async with semaphore:
+                        return await self._aprocess_and_upload_data(http_client, *row)
+
+                try:
+                    await asyncio.gather(*(_bounded_upload(row) for row in pending))
+                finally:
+                    await asyncio.to_thread(self._flush_uploaded)
+
+        # Send anonymous telemetry
+        self.telemetry.capture(event_name="deploy", properties=self._telemetry_props)
+
+    async def _aupload_data_to_pipeline(self, http_client, data_type, data_value, metadata=None):
+        payload = {
+            "data_type": data_type,
+            "data_value": data_value,
+            "metadata": metadata,
+        }
+        try:
+            response = await http_client.post(
+                f"{self.client.host}/api/v1/pipelines/{self.id}/cli/add/",
+                json=payload,
+                headers=self._get_auth_headers(),
+            )
+            response.raise_for_status()
+            self._print_data_uploaded(data_type, data_value, metadata)
+        except Exception as e:
+            print(f"❌ Error occurred during data upload for type {data_type}!. Error: {str(e)}")
+
+    async def _aprocess_and_upload_data(self, http_client, data_hash, data_type, data_value):
+        # Presigned url requests and file uploads block, so they run in a worker thread
+        item = await asyncio.to_thread(self._prepare_data_for_upload, data_hash, data_type, data_value)
+        if item is None:
+            return False
+
+        try:
+            await self._aupload_data_to_pipeline(http_client, item["data_type"], item["data_value"], item["metadata"])
+            self._mark_data_as_uploaded(data_hash)
+            return True
+        except Exception:
+            print(f"❌ Error occurred during data upload for hash {data_hash}!")
+            return False
+
     @classmethod
     def from_config(
         cls,
@@ -355,14 +743,7 @@ class App(EmbedChain):
         config_data = None
 
         if config_path:
-            file_extension = os.path.splitext(config_path)[1]
-            with open(config_path, "r", encoding="UTF-8") as file:
-                if file_extension in [".yaml", ".yml"]:
-                    config_data = yaml.safe_load(file)
-                elif file_extension == ".json":
-                    config_data = json.load(file)
-                else:
-                    raise ValueError("config_path must be a path to a YAML or JSON file.")
+            config_data = load_config_file(config_path)
         elif config and isinstance(config, dict):
             config_data = config
         else:
@@ -404,17 +785,21 @@ class App(EmbedChain):
         else:
             cache_config = None
 
-        return cls(
-            config=app_config,
-            llm=llm,
-            db=vector_db,
-            embedding_model=embedding_model,
-            config_data=config_data,
-            auto_deploy=auto_deploy,
-            chunker=chunker_config_data,
-            cache_config=cache_config,
-            memory_config=memory_config,
-        )
+        token = _validated_config_data.set(config_data)
+        try:
+            return cls(
+                config=app_config,
+                llm=llm,
+                db=vector_db,
+                embedding_model=embedding_model,
+                config_data=config_data,
+                auto_deploy=auto_deploy,
+                chunker=chunker_config_data,
+                cache_config=cache_config,
+                memory_config=memory_config,
+            )
+        finally:
+            _validated_config_data.reset(token)
 
     def _eval(self, dataset: list[EvalData], metric: Union[BaseMetric, str]):
         """
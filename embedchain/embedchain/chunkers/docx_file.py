@@ -1,12 +1,72 @@
+import re
+from bisect import bisect_left, bisect_right
 from typing import Optional
 
-from langchain.text_splitter import RecursiveCharacterTextSplitter
-
 from embedchain.chunkers.base_chunker import BaseChunker
 from embedchain.config.add_config import ChunkerConfig
 from embedchain.helpers.json_serializable import register_deserializable
 
 
+class _FastRecursiveSplitter:
+    """
+    Character based text splitter for large documents.
+
+    Like `RecursiveCharacterTextSplitter`, each chunk ends at the highest priority separator
+    (paragraph, line, sentence, clause, word) that still fits in `chunk_size`. All separators
+    are located in a single regex pass and the split points are looked up with bisect, instead
+    of repeatedly searching the text for every separator.
+    """
+
+    # Groups are ordered by priority, the group index is used to pick the split point list
+    _SEPARATORS = re.compile(r"(\n\n)|(\n)|([.!?] )|(, )|( )")
+    # Offset of the split point inside each separator match, punctuation stays with its chunk
+    _CUT_OFFSETS = (0, 0, 1, 1, 0)
+
+    def __init__(self, chunk_size: int, chunk_overlap: int, length_function=len):
+        self._chunk_size = chunk_size
+        self._chunk_overlap = chunk_overlap
+        self._length_function = length_function
+
+    def split_text(self, text: str) -> list[str]:
+        cuts_by_priority = [[] for _ in self._CUT_OFFSETS]
+        all_cuts = []
+        for match in self._SEPARATORS.finditer(text):
+            group = match.lastindex - 1
+            cut = match.start() + self._CUT_OFFSETS[group]
+            cuts_by_priority[group].append(cut)
+            all_cuts.append(cut)
+
+        chunks = []
+        start, text_length = 0, len(text)
+        while start < text_length:
+            limit = start + self._chunk_size
+            end = text_length if limit >= text_length else self._find_end(cuts_by_priority, start, limit)
+
+            chunk = text[start:end].strip()
+            if chunk:
+                chunks.append(chunk)
+            if end >= text_length:
+                break
+
+            next_start = end
+            if self._chunk_overlap:
+                # Start the next chunk at the first split point inside the overlap window
+                i = bisect_left(all_cuts, end - self._chunk_overlap)
+                if i < len(all_cuts) and start < all_cuts[i] < end:
+                    next_start = all_cuts[i]
+            start = next_start
+        return chunks
+
+    @staticmethod
+    def _find_end(cuts_by_priority: list[list[int]], start: int, limit: int) -> int:
+        for cuts in cuts_by_priority:
+            i = bisect_right(cuts, limit) - 1
+            if i >= 0 and cuts[i] > start:
+                return cuts[i]
+        # No separator in range, hard split at the chunk size
+        return limit
+
+
 @register_deserializable
 class DocxFileChunker(BaseChunker):
     """Chunker for .docx file."""
@@ -14,9 +74,19 @@ class DocxFileChunker(BaseChunker):
     def __init__(self, config: Optional[ChunkerConfig] = None):
         if config is None:
             config = ChunkerConfig(chunk_size=1000, chunk_overlap=0, length_function=len)
-        text_splitter = RecursiveCharacterTextSplitter(
-            chunk_size=config.chunk_size,
-            chunk_overlap=config.chunk_overlap,
-            length_function=config.length_function,
-        )
+        if config.length_function is len:
+            text_splitter = _FastRecursiveSplitter(
+                chunk_size=config.chunk_size,
+                chunk_overlap=config.chunk_overlap,
+                length_function=config.length_function,
+            )
+        else:
+            # Split points can only be computed ahead of time for character lengths
+            from langchain.text_splitter import RecursiveCharacterTextSplitter
+
+            text_splitter = RecursiveCharacterTextSplitter(
+                chunk_size=config.chunk_size,
+                chunk_overlap=config.chunk_overlap,
+                length_function=config.length_function,
+            )
         super().__init__(text_splitter)
@@ -1,3 +1,5 @@
+import copy
+import functools
 import json
 import logging
 import os
@@ -10,6 +12,13 @@ from embedchain.constants import CONFIG_DIR, CONFIG_FILE
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=1)
+def _read_config_file(config_file: str, mtime_ns: int, size: int) -> dict:
+    # `mtime_ns` and `size` are only part of the cache key, so a rewritten file is read again
+    with open(config_file, "r") as f:
+        return json.load(f)
+
+
 class Client:
     def __init__(self, api_key=None, host="https://apiv2.embedchain.ai"):
         self.config_data = self.load_config()
@@ -58,8 +67,9 @@ class Client:
         if not os.path.exists(CONFIG_FILE):
             cls.setup()
 
-        with open(CONFIG_FILE, "r") as config_file:
-            return json.load(config_file)
+        stat = os.stat(CONFIG_FILE)
+        # Copy so callers can mutate `config_data` without touching the cached dict
+        return copy.deepcopy(_read_config_file(CONFIG_FILE, stat.st_mtime_ns, stat.st_size))
 
     def save(self):
         self.config_data["api_key"] = self.api_key
@@ -17,6 +17,9 @@ class AppConfig(BaseAppConfig):
         id: Optional[str] = None,
         name: Optional[str] = None,
         collect_metrics: Optional[bool] = True,
+        deploy_max_workers: int = 16,
+        upload_batch_size: Optional[int] = None,
+        search_cache_ttl: Optional[float] = None,
         **kwargs,
     ):
         """
@@ -29,6 +32,20 @@ class AppConfig(BaseAppConfig):
         :type id: Optional[str], optional
         :param collect_metrics: Send anonymous telemetry to improve embedchain, defaults to True
         :type collect_metrics: Optional[bool], optional
+        :param deploy_max_workers: Maximum number of concurrent uploads during `app.deploy()`, defaults to 16
+        :type deploy_max_workers: int, optional
+        :param upload_batch_size: Experimental. Number of data sources added to the platform per request during
+        `app.deploy()`, through a `/cli/add/batch/` endpoint the platform does not document. Deploy falls back to
+        one request per data source when the endpoint is missing. `None` always adds each data source with its
+        own request, defaults to None
+        :type upload_batch_size: Optional[int], optional
+        :param search_cache_ttl: Seconds for which `app.search()` results are cached. Only writes made through this
+        app invalidate the cache, so leave it disabled when other processes write to the same collection,
+        defaults to None (disabled)
+        :type search_cache_ttl: Optional[float], optional
         """
         self.name = name
+        self.deploy_max_workers = deploy_max_workers
+        self.upload_batch_size = upload_batch_size
+        self.search_cache_ttl = search_cache_ttl
         super().__init__(log_level=log_level, id=id, collect_metrics=collect_metrics, **kwargs)
@@ -139,6 +139,7 @@ class BaseLlmConfig(BaseConfig):
         local: Optional[bool] = False,
         default_headers: Optional[Mapping[str, str]] = None,
         api_version: Optional[str] = None,
+        answer_cache_ttl: Optional[float] = None,
     ):
         """
         Initializes a configuration class instance for the LLM.
@@ -195,6 +196,9 @@ class BaseLlmConfig(BaseConfig):
         :type local: Optional[bool], optional
         :param default_headers: Set additional HTTP headers to be sent with requests to OpenAI
         :type default_headers: Optional[Mapping[str, str]], optional
+        :param answer_cache_ttl: Seconds for which answers to the same prompt are cached, only used by the gpt4all
+        provider with a temperature of 0, defaults to None (disabled)
+        :type answer_cache_ttl: Optional[float], optional
         :raises ValueError: If the template is not valid as template should
         contain $context and $query (and optionally $history)
         :raises ValueError: Stream is not boolean
@@ -233,6 +237,7 @@ class BaseLlmConfig(BaseConfig):
         self.default_headers = default_headers
         self.online = online
         self.api_version = api_version
+        self.answer_cache_ttl = answer_cache_ttl
 
         if token_usage:
             f = Path(__file__).resolve().parent.parent / "model_prices_and_context_window.json"
@@ -18,6 +18,7 @@ class PineconeDBConfig(BaseVectorDbConfig):
         hybrid_search: bool = False,
         bm25_encoder: any = None,
         batch_size: Optional[int] = 100,
+        pool_threads: Optional[int] = 30,
         **extra_params: dict[str, any],
     ):
         self.metric = metric
@@ -28,6 +29,7 @@ class PineconeDBConfig(BaseVectorDbConfig):
         self.hybrid_search = hybrid_search
         self.bm25_encoder = bm25_encoder
         self.batch_size = batch_size
+        self.pool_threads = pool_threads
         if pod_config is None and serverless_config is None:
             # If no config is provided, use the default pod spec config
             pod_environment = os.environ.get("PINECONE_ENV", "gcp-starter")
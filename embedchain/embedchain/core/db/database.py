@@ -2,13 +2,29 @@ import os
 
 from alembic import command
 from alembic.config import Config
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.engine.base import Engine
 from sqlalchemy.orm import Session as SQLAlchemySession
 from sqlalchemy.orm import scoped_session, sessionmaker
 
 from .models import Base
 
+# Applied to every new SQLite connection. WAL lets readers proceed during writes and, together with
+# synchronous=NORMAL, avoids an fsync on every commit.
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+)
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    cursor = dbapi_connection.cursor()
+    for pragma in SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
 
 class DatabaseManager:
     def __init__(self, echo: bool = False):
@@ -25,6 +41,8 @@ class DatabaseManager:
         if self.database_uri.startswith("sqlite"):
             connect_args["check_same_thread"] = False
         self.engine = create_engine(self.database_uri, echo=self.echo, connect_args=connect_args)
+        if self.database_uri.startswith("sqlite"):
+            event.listen(self.engine, "connect", _set_sqlite_pragmas)
         self._session_factory = scoped_session(sessionmaker(bind=self.engine))
         Base.metadata.bind = self.engine
 
@@ -1,6 +1,6 @@
 import uuid
 
-from sqlalchemy import TIMESTAMP, Column, Integer, String, Text, func
+from sqlalchemy import TIMESTAMP, Column, Index, Integer, String, Text, func, text
 from sqlalchemy.orm import declarative_base
 
 Base = declarative_base()
@@ -18,6 +18,17 @@ class DataSource(Base):
     meta_data = Column(Text, name="metadata")
     is_uploaded = Column(Integer, default=0)
 
+    __table_args__ = (
+        Index("ix_ec_data_sources_app_id_hash", "app_id", "hash"),
+        # Partial index holding only the rows `App.deploy` still has to upload
+        Index(
+            "ix_ec_data_sources_pending",
+            "app_id",
+            sqlite_where=text("is_uploaded = 0"),
+            postgresql_where=text("is_uploaded = 0"),
+        ),
+    )
+
 
 class ChatHistory(Base):
     __tablename__ = "ec_chat_history"
@@ -29,3 +40,17 @@ class ChatHistory(Base):
     answer = Column(Text)
     meta_data = Column(Text, name="metadata")
     created_at = Column(TIMESTAMP, default=func.current_timestamp(), index=True)
+
+
+class UploadedContent(Base):
+    """Files already uploaded to a pipeline, so redeploying it after a failed deploy skips re-uploading them."""
+
+    __tablename__ = "ec_uploaded_content"
+
+    hash = Column(Text, primary_key=True)
+    # The s3 key and presigned url are only valid for the pipeline they were issued for
+    pipeline_id = Column(Text, primary_key=True)
+    s3_key = Column(Text)
+    presigned_url = Column(Text)
+    # Unix timestamp of the upload, a file modified after it is uploaded again
+    uploaded_at = Column(Integer)
@@ -1,3 +1,4 @@
+import copy
 import hashlib
 import json
 import logging
@@ -19,6 +20,7 @@ from embedchain.core.db.models import ChatHistory, DataSource
 from embedchain.data_formatter import DataFormatter
 from embedchain.embedder.base import BaseEmbedder
 from embedchain.helpers.json_serializable import JSONSerializable
+from embedchain.helpers.lru_cache import make_cache_key
 from embedchain.llm.base import BaseLlm
 from embedchain.loaders.base_loader import BaseLoader
 from embedchain.models.data_type import (
@@ -36,6 +38,9 @@ logger = logging.getLogger(__name__)
 
 
 class EmbedChain(JSONSerializable):
+    # Optional `LRUCache` of search results, set up by subclasses that want one
+    _search_cache = None
+
     def __init__(
         self,
         config: BaseAppConfig,
@@ -192,11 +197,15 @@ class EmbedChain(JSONSerializable):
         documents, metadatas, _ids, new_chunks = self._load_and_embed(
             data_formatter.loader, data_formatter.chunker, source, metadata, source_hash, config, dry_run, **kwargs
         )
+        self._clear_search_cache()
         if data_type in {DataType.DOCS_SITE}:
             self.is_docs_site_instance = True
 
         # Convert the source to a string if it is not already
-        if not isinstance(source, str):
+        if data_type == DataType.QNA_PAIR and not isinstance(source, str):
+            # Stored as JSON so deploy can parse it without `ast.literal_eval`
+            source = json.dumps(list(source), ensure_ascii=False)
+        elif not isinstance(source, str):
             source = str(source)
 
         # Insert the data into the 'ec_data_sources' table
@@ -709,7 +718,20 @@ class EmbedChain(JSONSerializable):
             filter_type: filter_criteria,
         }
 
-        return [{"context": c[0], "metadata": c[1]} for c in self.db.query(**params)]
+        if self._search_cache is None:
+            return [{"context": c[0], "metadata": c[1]} for c in self.db.query(**params)]
+
+        cache_key = make_cache_key(self.db.config.collection_name, params)
+        results = self._search_cache.get(cache_key)
+        if results is None:
+            results = [{"context": c[0], "metadata": c[1]} for c in self.db.query(**params)]
+            self._search_cache.set(cache_key, results)
+        # Callers may mutate the results, never hand out the cached objects
+        return copy.deepcopy(results)
+
+    def _clear_search_cache(self):
+        if self._search_cache is not None:
+            self._search_cache.clear()
 
     def set_collection_name(self, name: str):
         """
@@ -721,6 +743,7 @@ class EmbedChain(JSONSerializable):
         :type name: str
         """
         self.db.set_collection_name(name)
+        self._clear_search_cache()
         # Create the collection if it does not exist
         self.db._get_or_create_collection(name)
         # TODO: Check whether it is necessary to assign to the `self.collection` attribute,
@@ -740,6 +763,7 @@ class EmbedChain(JSONSerializable):
             self.db_session.rollback()
             return None
         self.db.reset()
+        self._clear_search_cache()
         self.delete_all_chat_history(app_id=self.config.id)
         # Send anonymous telemetry
         if self.config.collect_metrics:
@@ -783,6 +807,7 @@ class EmbedChain(JSONSerializable):
             self.db_session.rollback()
             return None
         self.db.delete(where={"hash": source_id})
+        self._clear_search_cache()
         logger.info(f"Successfully deleted {source_id}")
         # Send anonymous telemetry
         if self.config.collect_metrics:
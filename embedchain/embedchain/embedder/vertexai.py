@@ -1,7 +1,5 @@
 from typing import Optional
 
-from langchain_google_vertexai import VertexAIEmbeddings
-
 from embedchain.config import BaseEmbedderConfig
 from embedchain.embedder.base import BaseEmbedder
 from embedchain.models import VectorDimensions
@@ -10,8 +8,15 @@ from embedchain.models import VectorDimensions
 class VertexAIEmbedder(BaseEmbedder):
     def __init__(self, config: Optional[BaseEmbedderConfig] = None):
         super().__init__(config=config)
+        try:
+            from langchain_google_vertexai import VertexAIEmbeddings
+        except ModuleNotFoundError:
+            raise ModuleNotFoundError(
+                "The required dependencies for VertexAI are not installed."
+                'Please install with `pip install --upgrade "embedchain[vertexai]"`'
+            ) from None
 
-        embeddings = VertexAIEmbeddings(model_name=config.model)
+        embeddings = VertexAIEmbeddings(model_name=self.config.model)
         embedding_fn = BaseEmbedder._langchain_default_concept(embeddings)
         self.set_embedding_fn(embedding_fn=embedding_fn)
 
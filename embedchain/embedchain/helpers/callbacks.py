@@ -1,5 +1,6 @@
 import queue
-from typing import Any, Union
+import threading
+from typing import Any, Optional, Union
 
 from langchain.callbacks.streaming_stdout import StreamingStdOutCallbackHandler
 from langchain.schema import LLMResult
@@ -10,6 +11,12 @@ This is a special item that is used to signal the end of the stream.
 """
 
 
+class GenerationCancelled(Exception):
+    """
+    Raised from the callback handler to stop a generation whose tokens are no longer consumed.
+    """
+
+
 class StreamingStdOutCallbackHandlerYield(StreamingStdOutCallbackHandler):
     """
     This is a callback handler that yields the tokens as they are generated.
@@ -21,13 +28,17 @@ class StreamingStdOutCallbackHandlerYield(StreamingStdOutCallbackHandler):
     The queue to write the tokens to as they are generated.
     """
 
-    def __init__(self, q: queue.Queue) -> None:
+    def __init__(self, q: queue.Queue, stop_event: Optional[threading.Event] = None) -> None:
         """
         Initialize the callback handler.
         q: The queue to write the tokens to as they are generated.
+        stop_event: Once set, the next token raises `GenerationCancelled` to stop the generation.
         """
         super().__init__()
         self.q = q
+        self.stop_event = stop_event
+        # Errors raised by callbacks are only logged by langchain, unless the handler asks for them to be raised
+        self.raise_error = stop_event is not None
 
     def on_llm_start(self, serialized: dict[str, Any], prompts: list[str], **kwargs: Any) -> None:
         """Run when LLM starts running."""
@@ -36,6 +47,8 @@ class StreamingStdOutCallbackHandlerYield(StreamingStdOutCallbackHandler):
 
     def on_llm_new_token(self, token: str, **kwargs: Any) -> None:
         """Run on new LLM token. Only available when streaming is enabled."""
+        if self.stop_event is not None and self.stop_event.is_set():
+            raise GenerationCancelled()
         self.q.put(token)
 
     def on_llm_end(self, response: LLMResult, **kwargs: Any) -> None:
@@ -44,7 +57,6 @@ class StreamingStdOutCallbackHandlerYield(StreamingStdOutCallbackHandler):
 
     def on_llm_error(self, error: Union[Exception, KeyboardInterrupt], **kwargs: Any) -> None:
         """Run when LLM errors."""
-        self.q.put("%s: %s" % (type(error).__name__, str(error)))
         self.q.put(STOP_ITEM)
 
 
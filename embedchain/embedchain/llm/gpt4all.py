@@ -1,30 +1,98 @@
+import logging
 import os
+import queue
+import threading
 from collections.abc import Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, Union
 
 from langchain.callbacks.stdout import StdOutCallbackHandler
-from langchain.callbacks.streaming_stdout import StreamingStdOutCallbackHandler
 
 from embedchain.config import BaseLlmConfig
+from embedchain.helpers.callbacks import (
+    STOP_ITEM,
+    GenerationCancelled,
+    StreamingStdOutCallbackHandlerYield,
+    generate,
+)
 from embedchain.helpers.json_serializable import register_deserializable
+from embedchain.helpers.lru_cache import LRUCache, make_cache_key
 from embedchain.llm.base import BaseLlm
 
+logger = logging.getLogger(__name__)
+
+# Loading a model from disk is expensive, so loaded models are shared by all GPT4ALLLlm instances
+_MODEL_CACHE = {}
+# The shared model instances are not safe for concurrent use, generation is serialized per model
+_MODEL_LOCKS = {}
+_CACHE_LOCK = threading.Lock()
+# Long-lived workers that run streamed generations while the caller consumes the tokens. Generations
+# of different models run concurrently, `_MODEL_LOCKS` serializes the ones sharing a model.
+# Local generation is CPU bound, so at most 4 streams run at once and the others wait for a worker.
+_STREAM_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="gpt4all")
+
 
 @register_deserializable
 class GPT4ALLLlm(BaseLlm):
+    DEFAULT_MODEL = "orca-mini-3b-gguf2-q4_0.gguf"
+
     def __init__(self, config: Optional[BaseLlmConfig] = None):
         super().__init__(config=config)
         if self.config.model is None:
-            self.config.model = "orca-mini-3b-gguf2-q4_0.gguf"
+            self.config.model = self.DEFAULT_MODEL
         self.instance = GPT4ALLLlm._get_instance(self.config.model)
-        self.instance.streaming = self.config.stream
+        self._init_answer_cache()
+
+    def __getstate__(self):
+        # The loaded model can't be pickled, it is taken from the model cache again on load
+        state = self.__dict__.copy()
+        state.pop("instance", None)
+        state.pop("_answer_cache", None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if self.config.model is None:
+            self.config.model = self.DEFAULT_MODEL
+        self.instance = GPT4ALLLlm._get_instance(self.config.model)
+        self._init_answer_cache()
+
+    def _init_answer_cache(self):
+        answer_cache_ttl = getattr(self.config, "answer_cache_ttl", None)
+        self._answer_cache = LRUCache(maxsize=1024, ttl=answer_cache_ttl) if answer_cache_ttl else None
 
     def get_llm_model_answer(self, prompt):
-        return self._get_answer(prompt=prompt, config=self.config)
+        # Answers are only reproducible without sampling, so they are not cached at a temperature above 0
+        if self.config.stream or self._answer_cache is None or self.config.temperature > 0:
+            return self._get_answer(prompt=prompt, config=self.config)
+
+        cache_key = make_cache_key(
+            self.config.model,
+            self.config.system_prompt,
+            prompt,
+            self.config.temperature,
+            self.config.top_p,
+            self.config.max_tokens,
+        )
+        answer = self._answer_cache.get(cache_key)
+        if answer is None:
+            answer = self._get_answer(prompt=prompt, config=self.config)
+            self._answer_cache.set(cache_key, answer)
+        return answer
 
     @staticmethod
     def _get_instance(model):
+        with _CACHE_LOCK:
+            instance = _MODEL_CACHE.get(model)
+            if instance is None:
+                instance = GPT4ALLLlm._load_instance(model)
+                _MODEL_CACHE[model] = instance
+                _MODEL_LOCKS[model] = threading.Lock()
+            return instance
+
+    @staticmethod
+    def _load_instance(model):
         try:
             from langchain_community.llms.gpt4all import GPT4All as LangchainGPT4All
         except ModuleNotFoundError:
@@ -58,9 +126,50 @@ class GPT4ALLLlm(BaseLlm):
         if config.top_p:
             kwargs["top_p"] = config.top_p
 
-        callbacks = [StreamingStdOutCallbackHandler()] if config.stream else [StdOutCallbackHandler()]
+        if config.stream:
+            # Tokens are pushed to the queue by the callback as they are generated and yielded to the caller
+            token_queue = queue.Queue()
+            stop_event = threading.Event()
+            callbacks = [StreamingStdOutCallbackHandlerYield(token_queue, stop_event=stop_event)]
+            future = _STREAM_EXECUTOR.submit(self._generate, messages, callbacks, kwargs, True, token_queue)
+            return self._stream(token_queue, future, stop_event)
+
+        return self._generate(messages, [StdOutCallbackHandler()], kwargs)
 
-        response = self.instance.generate(prompts=messages, callbacks=callbacks, **kwargs)
+    @staticmethod
+    def _stream(token_queue: queue.Queue, future: Future, stop_event: threading.Event) -> Iterable[str]:
+        try:
+            yield from generate(token_queue)
+        except GeneratorExit:
+            # The caller stopped consuming, free the worker and the model lock instead of generating the rest
+            future.cancel()
+            stop_event.set()
+            raise
+        # The worker always ends the stream, re-raise the error if it stopped because generation failed
+        future.result()
+
+    def _generate(
+        self,
+        messages: list[str],
+        callbacks: list,
+        kwargs: dict,
+        stream: bool = False,
+        token_queue: Optional[queue.Queue] = None,
+    ) -> str:
+        try:
+            with _MODEL_LOCKS.setdefault(self.config.model, threading.Lock()):
+                self.instance.streaming = stream
+                response = self.instance.generate(prompts=messages, callbacks=callbacks, **kwargs)
+        except GenerationCancelled:
+            logger.debug("GPT4All generation cancelled, the stream was closed")
+            return ""
+        except Exception:
+            logger.exception("Error occurred during GPT4All generation")
+            raise
+        finally:
+            if token_queue is not None:
+                # Make sure the consuming generator stops even if generation failed before it started
+                token_queue.put(STOP_ITEM)
         answer = ""
         for generations in response.generations:
             answer += " ".join(map(lambda generation: generation.text, generations))
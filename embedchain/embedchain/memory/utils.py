@@ -1,5 +1,7 @@
 from typing import Any, Optional
 
+_MISSING = object()
+
 
 def merge_metadata_dict(left: Optional[dict[str, Any]], right: Optional[dict[str, Any]]) -> Optional[dict[str, Any]]:
     """
@@ -19,17 +21,36 @@ def merge_metadata_dict(left: Optional[dict[str, Any]], right: Optional[dict[str
         return right
     elif not right:
         return left
+    elif right.keys().isdisjoint(left):
+        return {**left, **right}
 
     merged = left.copy()
-    for k, v in right.items():
-        if k not in merged:
-            merged[k] = v
-        elif type(merged[k]) != type(v):
-            raise ValueError(f'additional_kwargs["{k}"] already exists in this message,' " but with a different type.")
-        elif isinstance(merged[k], str):
-            merged[k] += v
-        elif isinstance(merged[k], dict):
-            merged[k] = merge_metadata_dict(merged[k], v)
-        else:
-            raise ValueError(f"Additional kwargs key {k} already exists in this message.")
+    # Nested dicts are merged iteratively, each entry is a (partially merged copy, dict to merge in) pair
+    stack = [(merged, right)]
+    while stack:
+        target, source = stack.pop()
+        for k, v in source.items():
+            current = target.get(k, _MISSING)
+            if current is _MISSING:
+                target[k] = v
+                continue
+
+            if type(current) is not type(v):
+                raise ValueError(
+                    f'additional_kwargs["{k}"] already exists in this message,' " but with a different type."
+                )
+            elif isinstance(v, str):
+                target[k] = current + v
+            elif isinstance(v, dict):
+                if not current and not v:
+                    target[k] = None
+                elif not v:
+                    continue
+                elif not current:
+                    target[k] = v
+                else:
+                    target[k] = current.copy()
+                    stack.append((target[k], v))
+            else:
+                raise ValueError(f"Additional kwargs key {k} already exists in this message.")
     return merged
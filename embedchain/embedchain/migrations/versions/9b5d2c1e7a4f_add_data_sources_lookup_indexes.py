@@ -0,0 +1,36 @@
+"""Add data sources lookup indexes
+
+Revision ID: 9b5d2c1e7a4f
+Revises: 40a327b3debd
+Create Date: 2026-10-14 10:12:41.218305
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9b5d2c1e7a4f"
+down_revision: Union[str, None] = "40a327b3debd"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_ec_data_sources_app_id_hash", "ec_data_sources", ["app_id", "hash"], unique=False)
+    # Partial index holding only the rows `App.deploy` still has to upload
+    op.create_index(
+        "ix_ec_data_sources_pending",
+        "ec_data_sources",
+        ["app_id"],
+        unique=False,
+        sqlite_where=sa.text("is_uploaded = 0"),
+        postgresql_where=sa.text("is_uploaded = 0"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_ec_data_sources_pending", table_name="ec_data_sources")
+    op.drop_index("ix_ec_data_sources_app_id_hash", table_name="ec_data_sources")
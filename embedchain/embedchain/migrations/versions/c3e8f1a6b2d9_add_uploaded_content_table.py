@@ -0,0 +1,34 @@
+"""Add uploaded content table
+
+Revision ID: c3e8f1a6b2d9
+Revises: 9b5d2c1e7a4f
+Create Date: 2026-10-14 11:03:27.640192
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c3e8f1a6b2d9"
+down_revision: Union[str, None] = "9b5d2c1e7a4f"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "ec_uploaded_content",
+        sa.Column("hash", sa.Text(), nullable=False),
+        sa.Column("pipeline_id", sa.Text(), nullable=False),
+        sa.Column("s3_key", sa.Text(), nullable=True),
+        sa.Column("presigned_url", sa.Text(), nullable=True),
+        sa.Column("uploaded_at", sa.Integer(), nullable=True),
+        sa.PrimaryKeyConstraint("hash", "pipeline_id"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("ec_uploaded_content")
@@ -396,6 +396,9 @@ def validate_config(config_data):
                     Optional("log_level"): Or("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"),
                     Optional("collect_metrics"): bool,
                     Optional("collection_name"): str,
+                    Optional("deploy_max_workers"): int,
+                    Optional("upload_batch_size"): Or(int, None),
+                    Optional("search_cache_ttl"): Or(int, float, None),
                 }
             },
             Optional("llm"): {
@@ -445,6 +448,7 @@ def validate_config(config_data):
                     Optional("api_version"): Or(str, datetime.date),
                     Optional("http_client_proxies"): Or(str, dict),
                     Optional("http_async_client_proxies"): Or(str, dict),
+                    Optional("answer_cache_ttl"): Or(int, float, None),
                 },
             },
             Optional("vectordb"): {
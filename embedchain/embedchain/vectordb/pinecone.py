@@ -18,6 +18,9 @@ from embedchain.vectordb.base import BaseVectorDB
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of ids Pinecone accepts in a single fetch request
+FETCH_BATCH_SIZE = 1000
+
 
 @register_deserializable
 class PineconeDB(BaseVectorDB):
@@ -86,7 +89,8 @@ class PineconeDB(BaseVectorDB):
                 dimension=self.config.vector_dimension,
                 spec=spec,
             )
-        self.pinecone_index = self.client.Index(self.config.index_name)
+        # `pool_threads` sizes the thread pool used by `async_req` upserts
+        self.pinecone_index = self.client.Index(self.config.index_name, pool_threads=self.config.pool_threads)
 
     def get(self, ids: Optional[list[str]] = None, where: Optional[dict[str, any]] = None, limit: Optional[int] = None):
         """
@@ -102,13 +106,19 @@ class PineconeDB(BaseVectorDB):
         existing_ids = list()
         metadatas = []
 
-        if ids is not None:
-            for i in range(0, len(ids), self.batch_size):
-                result = self.pinecone_index.fetch(ids=ids[i : i + self.batch_size])
+        if ids:
+            batches = [ids[i : i + FETCH_BATCH_SIZE] for i in range(0, len(ids), FETCH_BATCH_SIZE)]
+            if len(batches) == 1:
+                results = [self.pinecone_index.fetch(ids=batches[0])]
+            else:
+                # Send all fetches at once on the index thread pool, then collect them in order
+                pending_fetches = [self.pinecone_index.fetch(ids=batch, async_req=True) for batch in batches]
+                results = [pending_fetch.get() for pending_fetch in pending_fetches]
+
+            for result in results:
                 vectors = result.get("vectors")
-                batch_existing_ids = list(vectors.keys())
-                existing_ids.extend(batch_existing_ids)
-                metadatas.extend([vectors.get(ids).get("metadata") for ids in batch_existing_ids])
+                existing_ids.extend(vectors.keys())
+                metadatas.extend(vector.get("metadata") for vector in vectors.values())
         return {"ids": existing_ids, "metadatas": metadatas}
 
     def add(
@@ -127,24 +137,30 @@ class PineconeDB(BaseVectorDB):
         :param ids: ids of docs
         :type ids: list[str]
         """
-        docs = []
-        embeddings = self.embedder.embedding_fn(documents)
-        for id, text, metadata, embedding in zip(ids, documents, metadatas, embeddings):
-            # Insert sparse vectors as well if the user wants to do the hybrid search
-            sparse_vector_dict = (
-                {"sparse_values": self.bm25_encoder.encode_documents(text)} if self.bm25_encoder else {}
-            )
-            docs.append(
-                {
-                    "id": id,
-                    "values": embedding,
-                    "metadata": {**metadata, "text": text},
-                    **sparse_vector_dict,
-                },
-            )
+        pending_upserts = []
+        for batch in chunks(list(zip(ids, documents, metadatas)), self.batch_size, desc="Adding chunks in batches"):
+            batch_ids, batch_documents, batch_metadatas = zip(*batch)
+            # Embed batch by batch, so the next batch is embedded while the previous upserts are in flight
+            embeddings = self.embedder.embedding_fn(list(batch_documents))
+            docs = []
+            for id, text, metadata, embedding in zip(batch_ids, batch_documents, batch_metadatas, embeddings):
+                # Insert sparse vectors as well if the user wants to do the hybrid search
+                sparse_vector_dict = (
+                    {"sparse_values": self.bm25_encoder.encode_documents(text)} if self.bm25_encoder else {}
+                )
+                docs.append(
+                    {
+                        "id": id,
+                        "values": embedding,
+                        "metadata": {**metadata, "text": text},
+                        **sparse_vector_dict,
+                    },
+                )
+            pending_upserts.append(self.pinecone_index.upsert(docs, async_req=True, **kwargs))
 
-        for chunk in chunks(docs, self.batch_size, desc="Adding chunks in batches"):
-            self.pinecone_index.upsert(chunk, **kwargs)
+        # Wait for all upserts, this raises if one of them failed
+        for pending_upsert in pending_upserts:
+            pending_upsert.get()
 
     def query(
         self,
@@ -5,6 +5,7 @@ import aiofiles
 import yaml
 from database import Base, SessionLocal, engine
 from fastapi import Depends, FastAPI, HTTPException, UploadFile
+from fastapi.concurrency import run_in_threadpool
 from models import DefaultResponse, DeployAppRequest, QueryApp, SourceApp
 from services import get_app, get_apps, remove_app, save_app
 from sqlalchemy.orm import Session
@@ -111,9 +112,10 @@ async def get_datasources_associated_with_app_id(app_id: str, db: Session = Depe
         if db_app is None:
             raise HTTPException(detail=f"App with id {app_id} does not exist, please create it first.", status_code=400)
 
-        app = App.from_config(config_path=db_app.config)
+        # App creation and its methods do blocking I/O, keep them off the event loop
+        app = await run_in_threadpool(App.from_config, config_path=db_app.config)
 
-        response = app.get_data_sources()
+        response = await run_in_threadpool(app.get_data_sources)
         return {"results": response}
     except ValueError as ve:
         logger.warning(str(ve))
@@ -150,9 +152,10 @@ async def add_datasource_to_an_app(body: SourceApp, app_id: str, db: Session = D
         if db_app is None:
             raise HTTPException(detail=f"App with id {app_id} does not exist, please create it first.", status_code=400)
 
-        app = App.from_config(config_path=db_app.config)
+        # App creation and its methods do blocking I/O, keep them off the event loop
+        app = await run_in_threadpool(App.from_config, config_path=db_app.config)
 
-        response = app.add(source=body.source, data_type=body.data_type)
+        response = await run_in_threadpool(app.add, source=body.source, data_type=body.data_type)
         return DefaultResponse(response=response)
     except ValueError as ve:
         logger.warning(str(ve))
@@ -188,9 +191,10 @@ async def query_an_app(body: QueryApp, app_id: str, db: Session = Depends(get_db
         if db_app is None:
             raise HTTPException(detail=f"App with id {app_id} does not exist, please create it first.", status_code=400)
 
-        app = App.from_config(config_path=db_app.config)
+        # App creation and its methods do blocking I/O, keep them off the event loop
+        app = await run_in_threadpool(App.from_config, config_path=db_app.config)
 
-        response = app.query(body.query)
+        response = await run_in_threadpool(app.query, body.query)
         return DefaultResponse(response=response)
     except ValueError as ve:
         logger.warning(str(ve))
@@ -267,13 +271,14 @@ async def deploy_app(body: DeployAppRequest, app_id: str, db: Session = Depends(
         if db_app is None:
             raise HTTPException(detail=f"App with id {app_id} does not exist, please create it first.", status_code=400)
 
-        app = App.from_config(config_path=db_app.config)
+        # App creation and its methods do blocking I/O, keep them off the event loop
+        app = await run_in_threadpool(App.from_config, config_path=db_app.config)
 
         api_key = body.api_key
-        # this will save the api key in the embedchain.db
-        Client(api_key=api_key)
+        # this will save the api key in the embedchain.db, validating it is a blocking request
+        await run_in_threadpool(Client, api_key=api_key)
 
-        app.deploy()
+        await app.adeploy()
         return DefaultResponse(response="App deployed successfully.")
     except ValueError as ve:
         logger.warning(str(ve))
@@ -308,10 +313,11 @@ async def delete_app(app_id: str, db: Session = Depends(get_db)):
         if db_app is None:
             raise HTTPException(detail=f"App with id {app_id} does not exist, please create it first.", status_code=400)
 
-        app = App.from_config(config_path=db_app.config)
+        # App creation and its methods do blocking I/O, keep them off the event loop
+        app = await run_in_threadpool(App.from_config, config_path=db_app.config)
 
         # reset app.db
-        app.db.reset()
+        await run_in_threadpool(app.db.reset)
 
         remove_app(db, app_id)
         return DefaultResponse(response=f"App with id {app_id} deleted successfully.")
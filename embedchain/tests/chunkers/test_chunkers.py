@@ -64,3 +64,14 @@ def test_custom_config_values():
         assert chunker.text_splitter._chunk_size == 500
         assert chunker.text_splitter._chunk_overlap == 0
         assert chunker.text_splitter._length_function == len
+
+
+def test_docx_file_chunker_splits_on_separators():
+    chunker = DocxFileChunker(config=ChunkerConfig(chunk_size=40, chunk_overlap=0, length_function=len))
+    text = "Para one is here. It has two sentences.\n\nPara two, with a clause, is longer than that.\n" + "x" * 50
+
+    chunks = chunker.get_chunks(text)
+
+    assert chunks[0] == "Para one is here. It has two sentences."
+    assert all(len(chunk) <= 40 for chunk in chunks)
+    assert "".join(chunks).replace(" ", "") == text.replace(" ", "").replace("\n", "")
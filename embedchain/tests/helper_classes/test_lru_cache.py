@@ -0,0 +1,29 @@
+from embedchain.helpers.lru_cache import LRUCache, make_cache_key
+
+
+def test_make_cache_key_is_stable():
+    assert make_cache_key("query", {"b": 1, "a": 2}) == make_cache_key("query", {"a": 2, "b": 1})
+    assert make_cache_key("query", 1) != make_cache_key("query", 2)
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+
+    assert "a" in cache
+    assert "b" not in cache
+    assert cache.get("c") == 3
+
+
+def test_lru_cache_expires_entries(mocker):
+    mocked_time = mocker.patch("embedchain.helpers.lru_cache.time.monotonic", return_value=100.0)
+    cache = LRUCache(maxsize=2, ttl=10)
+    cache.set("a", 1)
+    assert cache.get("a") == 1
+
+    mocked_time.return_value = 111.0
+    assert cache.get("a") is None
+    assert len(cache) == 0
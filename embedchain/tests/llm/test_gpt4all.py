@@ -1,7 +1,10 @@
+import threading
+
 import pytest
 from langchain_community.llms.gpt4all import GPT4All as LangchainGPT4All
 
 from embedchain.config import BaseLlmConfig
+from embedchain.helpers.callbacks import GenerationCancelled
 from embedchain.llm.gpt4all import GPT4ALLLlm
 
 
@@ -44,6 +47,20 @@ def test_gpt4all_init_without_config(gpt4all_without_config):
     assert isinstance(gpt4all_without_config.instance, LangchainGPT4All)
 
 
+def test_gpt4all_instance_is_shared(config, gpt4all_with_config):
+    assert GPT4ALLLlm(config=config).instance is gpt4all_with_config.instance
+
+
+def test_gpt4all_state_excludes_model(gpt4all_with_config):
+    state = gpt4all_with_config.__getstate__()
+    assert "instance" not in state
+
+    restored = GPT4ALLLlm.__new__(GPT4ALLLlm)
+    restored.__setstate__(state)
+    assert restored.config is gpt4all_with_config.config
+    assert restored.instance is gpt4all_with_config.instance
+
+
 def test_get_llm_model_answer(mocker, gpt4all_with_config):
     test_query = "Test query"
     test_answer = "Test answer"
@@ -55,6 +72,70 @@ def test_get_llm_model_answer(mocker, gpt4all_with_config):
     mocked_get_answer.assert_called_once_with(prompt=test_query, config=gpt4all_with_config.config)
 
 
+@pytest.mark.parametrize("temperature, expected_calls", [(0, 1), (0.7, 2)])
+def test_get_llm_model_answer_cache(mocker, config, temperature, expected_calls):
+    config.temperature = temperature
+    config.answer_cache_ttl = 300
+    llm = GPT4ALLLlm(config=config)
+    mocked_get_answer = mocker.patch("embedchain.llm.gpt4all.GPT4ALLLlm._get_answer", return_value="Test answer")
+
+    assert llm.get_llm_model_answer("Test query") == "Test answer"
+    assert llm.get_llm_model_answer("Test query") == "Test answer"
+    assert mocked_get_answer.call_count == expected_calls
+
+
+def test_gpt4all_stream_yields_tokens(mocker, config, gpt4all_with_config):
+    def fake_generate(self, prompts, callbacks, **kwargs):
+        for token in ["Hello", " world"]:
+            callbacks[0].on_llm_new_token(token)
+        callbacks[0].on_llm_end(None)
+        return mocker.Mock(generations=[])
+
+    mocker.patch.object(LangchainGPT4All, "generate", fake_generate)
+    config.stream = True
+
+    answer = gpt4all_with_config._get_answer("Test prompt", config)
+
+    assert not isinstance(answer, str)
+    assert list(answer) == ["Hello", " world"]
+
+
+def test_gpt4all_stream_raises_generation_error(mocker, config, gpt4all_with_config):
+    mocker.patch.object(LangchainGPT4All, "generate", side_effect=RuntimeError("Generation failed"))
+    config.stream = True
+
+    answer = gpt4all_with_config._get_answer("Test prompt", config)
+
+    with pytest.raises(RuntimeError, match="Generation failed"):
+        list(answer)
+
+
+def test_gpt4all_stream_close_cancels_generation(mocker, config, gpt4all_with_config):
+    closed = threading.Event()
+    cancelled = threading.Event()
+
+    def fake_generate(self, prompts, callbacks, **kwargs):
+        callbacks[0].on_llm_new_token("Hello")
+        closed.wait(timeout=5)
+        try:
+            callbacks[0].on_llm_new_token(" world")
+        except GenerationCancelled:
+            cancelled.set()
+            raise
+        callbacks[0].on_llm_end(None)
+        return mocker.Mock(generations=[])
+
+    mocker.patch.object(LangchainGPT4All, "generate", fake_generate)
+    config.stream = True
+
+    answer = gpt4all_with_config._get_answer("Test prompt", config)
+    assert next(answer) == "Hello"
+    answer.close()
+    closed.set()
+
+    assert cancelled.wait(timeout=5)
+
+
 def test_gpt4all_model_switching(gpt4all_with_config):
     with pytest.raises(RuntimeError, match="GPT4ALLLlm does not support switching models at runtime."):
         gpt4all_with_config._get_answer("Test prompt", BaseLlmConfig(model="new_model"))
@@ -0,0 +1,38 @@
+import pytest
+
+from embedchain.memory.utils import merge_metadata_dict
+
+
+def test_merge_metadata_dict_empty():
+    assert merge_metadata_dict(None, None) is None
+    assert merge_metadata_dict({}, {"a": "b"}) == {"a": "b"}
+    assert merge_metadata_dict({"a": "b"}, None) == {"a": "b"}
+
+
+def test_merge_metadata_dict_disjoint_keys():
+    assert merge_metadata_dict({"a": 1}, {"b": 2}) == {"a": 1, "b": 2}
+
+
+def test_merge_metadata_dict_nested():
+    left = {"text": "foo", "nested": {"text": "bar", "deep": {"text": "baz"}}}
+    right = {"text": "1", "nested": {"text": "2", "deep": {"text": "3"}, "new": 4}}
+
+    merged = merge_metadata_dict(left, right)
+
+    assert merged == {"text": "foo1", "nested": {"text": "bar2", "deep": {"text": "baz3"}, "new": 4}}
+    # Inputs are left untouched
+    assert left == {"text": "foo", "nested": {"text": "bar", "deep": {"text": "baz"}}}
+
+
+def test_merge_metadata_dict_conflicts():
+    with pytest.raises(ValueError, match="but with a different type"):
+        merge_metadata_dict({"a": "b"}, {"a": 1})
+    with pytest.raises(ValueError, match="already exists in this message"):
+        merge_metadata_dict({"a": 1}, {"a": 2})
+
+
+def test_merge_metadata_dict_str_subclass():
+    class Text(str):
+        pass
+
+    assert merge_metadata_dict({"text": Text("foo")}, {"text": Text("bar")}) == {"text": "foobar"}
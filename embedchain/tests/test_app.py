@@ -1,10 +1,14 @@
+import concurrent.futures
 import os
+import time
 
+import httpx
 import pytest
 import yaml
 
 from embedchain import App
-from embedchain.config import ChromaDbConfig
+from embedchain.app import PRESIGNED_URL_EXPIRY, _load_qna_pair, load_config_file
+from embedchain.config import AppConfig, ChromaDbConfig
 from embedchain.embedder.base import BaseEmbedder
 from embedchain.llm.base import BaseLlm
 from embedchain.vectordb.base import BaseVectorDB
@@ -24,6 +28,152 @@ def test_app(app):
     assert isinstance(app.embedding_model, BaseEmbedder)
 
 
+def test_search_results_are_cached(mocker):
+    app = App(config=AppConfig(search_cache_ttl=300))
+    mocked_query = mocker.patch.object(app.db, "query", return_value=[("context", {"url": "url"})])
+
+    assert app.search("query") == [{"context": "context", "metadata": {"url": "url"}}]
+    assert app.search("query") == [{"context": "context", "metadata": {"url": "url"}}]
+    mocked_query.assert_called_once()
+
+    app.search("query", num_documents=5)
+    assert mocked_query.call_count == 2
+
+    app._clear_search_cache()
+    app.search("query")
+    assert mocked_query.call_count == 3
+
+
+def test_search_results_are_not_cached_by_default(app, mocker):
+    mocked_query = mocker.patch.object(app.db, "query", return_value=[("context", {"url": "url"})])
+
+    app.search("query")
+    app.search("query")
+    assert mocked_query.call_count == 2
+
+
+@pytest.mark.parametrize("stored", ['["question", "answer"]', "('question', 'answer')"])
+def test_load_qna_pair(stored):
+    assert _load_qna_pair(stored) == ["question", "answer"]
+
+
+def test_uploaded_content_is_reused(app, tmp_path, mocker):
+    file_path = tmp_path / "file.txt"
+    file_path.write_text("content")
+    os.utime(file_path, (time.time() - 60, time.time() - 60))
+    app.id = "pipeline-id"
+    app._mark_content_as_uploaded("hash", "s3-key", "https://presigned.url")
+    app._flush_uploaded()
+
+    assert app._get_uploaded_content("hash", str(file_path)) == ("s3-key", "https://presigned.url")
+
+    # Expired presigned url
+    mocker.patch("embedchain.app.time.time", return_value=time.time() + PRESIGNED_URL_EXPIRY)
+    assert app._get_uploaded_content("hash", str(file_path)) is None
+    mocker.stopall()
+
+    # Content uploaded for another pipeline
+    app.id = "other-pipeline-id"
+    assert app._get_uploaded_content("hash", str(file_path)) is None
+
+    # File removed since its upload
+    app.id = "pipeline-id"
+    file_path.unlink()
+    assert app._get_uploaded_content("hash", str(file_path)) is None
+
+
+def test_client_follows_stored_api_key(app, mocker):
+    mocker.patch("embedchain.app._CLIENTS", {})
+    mock_client = mocker.patch("embedchain.app.Client")
+    mock_client.load_config.return_value = {"api_key": "first-key"}
+    app._init_client()
+    first_client = app.client
+
+    app._init_client()
+    assert app.client is first_client
+    mock_client.assert_called_once_with()
+
+    mock_client.load_config.return_value = {"api_key": "second-key"}
+    mock_client.return_value = mocker.Mock()
+    app._init_client()
+    assert app.client is not first_client
+    app.close()
+
+
+def test_platform_requests_are_retried_when_unavailable(app, tmp_path, mocker):
+    statuses = iter([503, 200, 503, 200, 503])
+    requests = []
+
+    def handler(request):
+        requests.append((request.method, request.read()))
+        return httpx.Response(next(statuses), json={"id": "pipeline-id"})
+
+    mocker.patch("embedchain.app.httpx.HTTPTransport", return_value=httpx.MockTransport(handler))
+    mocker.patch("embedchain.app.time.sleep")
+    app.client = mocker.Mock(host="https://api.embedchain.ai", api_key="api-key")
+    app._init_http_client()
+
+    assert app._get_pipeline("pipeline-id") == {"id": "pipeline-id"}
+    assert [method for method, _ in requests] == ["GET", "GET"]
+
+    # The file is read again for the retried upload
+    file_path = tmp_path / "file.txt"
+    file_path.write_text("content")
+    requests.clear()
+    assert app._upload_file_to_presigned_url("https://s3.amazonaws.com/presigned", str(file_path))
+    assert requests == [("PUT", b"content"), ("PUT", b"content")]
+
+    # A failed POST may have been processed, it is not sent again
+    requests.clear()
+    with pytest.raises(httpx.HTTPStatusError):
+        app._send_api_request("/api/v1/pipelines/pipeline-id/cli/add/", {})
+    assert len(requests) == 1
+    app.close()
+
+
+def test_batch_upload_falls_back_without_batch_endpoint(app, mocker):
+    paths = []
+
+    def handler(request):
+        paths.append(request.url.path)
+        return httpx.Response(404 if request.url.path.endswith("/batch/") else 200, json={})
+
+    mocker.patch("embedchain.app.httpx.HTTPTransport", return_value=httpx.MockTransport(handler))
+    app.client = mocker.Mock(host="https://api.embedchain.ai", api_key="api-key")
+    app.id = "pipeline-id"
+    app._init_http_client()
+    items = [
+        {"data_hash": f"hash-{i}", "data_type": "text", "data_value": f"text {i}", "metadata": {}} for i in range(2)
+    ]
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        app._batch_upload_data_to_pipeline(items, executor)
+        app._batch_upload_data_to_pipeline(items, executor)
+
+    # The batch endpoint is only tried once, afterwards each item is added with its own request
+    assert paths.count("/api/v1/pipelines/pipeline-id/cli/add/batch/") == 1
+    assert paths.count("/api/v1/pipelines/pipeline-id/cli/add/") == 4
+    assert app._uploaded_buffer == ["hash-0", "hash-1", "hash-0", "hash-1"]
+    app.close()
+
+
+def test_load_config_file_is_cached(tmp_path, mocker):
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("app:\n  config:\n    id: first\n")
+    mocked_load = mocker.spy(yaml, "load")
+
+    assert load_config_file(str(config_file)) == {"app": {"config": {"id": "first"}}}
+    load_config_file(str(config_file))["app"] = "mutated"
+    assert load_config_file(str(config_file)) == {"app": {"config": {"id": "first"}}}
+    assert mocked_load.call_count == 1
+
+    config_file.write_text("app:\n  config:\n    id: second\n")
+    stat = os.stat(config_file)
+    os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    assert load_config_file(str(config_file)) == {"app": {"config": {"id": "second"}}}
+    assert mocked_load.call_count == 2
+
+
 class TestConfigForAppComponents:
     def test_constructor_config(self):
         collection_name = "my-test-collection"
@@ -109,3 +259,14 @@ class TestAppFromConfig:
         # Validate the Embedder config values
         embedder_config = config_data["embedder"]["config"]
         assert app.embedding_model.config.deployment_name == embedder_config["deployment_name"]
+
+    def test_from_config_validates_once(self, mocker):
+        mocker.patch("embedchain.vectordb.chroma.chromadb.Client")
+        mocker.patch.dict(os.environ, {"OPENAI_API_KEY": "test-api-key"})
+        mocked_validate = mocker.patch("embedchain.app.validate_config", return_value=True)
+        config_data = {"app": {"config": {"id": "app-id"}}}
+
+        app = App.from_config(config=config_data)
+
+        assert app.config_data is config_data
+        mocked_validate.assert_called_once_with(config_data)
@@ -1,3 +1,6 @@
+import json
+import os
+
 import pytest
 
 from embedchain import Client
@@ -51,3 +54,20 @@ class TestClient:
         mocker.patch("embedchain.Client.load_config", return_value={})
         with pytest.raises(ValueError):
             Client()
+
+    def test_load_config_is_cached_until_file_changes(self, mocker, tmp_path):
+        config_file = tmp_path / "config.json"
+        config_file.write_text(json.dumps({"user_id": "user"}))
+        mocker.patch("embedchain.client.CONFIG_FILE", str(config_file))
+        mocked_load = mocker.spy(json, "load")
+
+        assert Client.load_config() == {"user_id": "user"}
+        Client.load_config()["api_key"] = "mutated"
+        assert Client.load_config() == {"user_id": "user"}
+        assert mocked_load.call_count == 1
+
+        config_file.write_text(json.dumps({"user_id": "user", "api_key": "key"}))
+        stat = os.stat(config_file)
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+        assert Client.load_config() == {"user_id": "user", "api_key": "key"}
+        assert mocked_load.call_count == 2
@@ -62,6 +62,14 @@ class MockListIndexes:
         return ["test_collection"]
 
 
+class MockAsyncResult:
+    def __init__(self, result=None):
+        self.result = result
+
+    def get(self):
+        return self.result
+
+
 class MockPineconeIndex:
     db = []
 
@@ -70,7 +78,7 @@ class MockPineconeIndex:
 
     def upsert(self, chunk, **kwargs):
         self.db.extend([c for c in chunk])
-        return
+        return MockAsyncResult({"upserted_count": len(chunk)}) if kwargs.get("async_req") else None
 
     def delete(self, *args, **kwargs):
         pass
@@ -96,6 +104,8 @@ class MockPineconeIndex:
         }
 
     def fetch(self, *args, **kwargs):
+        if kwargs.get("async_req"):
+            return MockAsyncResult({"vectors": {id: {"metadata": {"source": id}} for id in kwargs["ids"]}})
         return {
             "vectors": {
                 "key_1": {
@@ -184,6 +194,12 @@ def test_get(monkeypatch):
     ids = pinecone_db.get(["key_1", "key_2"])
     assert ids == {"ids": ["key_1", "key_2"], "metadatas": [{"source": "1"}, {"source": "2"}]}
 
+    # More ids than a single fetch accepts are fetched in parallel batches
+    many_ids = [f"key_{i}" for i in range(1500)]
+    result = pinecone_db.get(many_ids)
+    assert result["ids"] == many_ids
+    assert result["metadatas"] == [{"source": id} for id in many_ids]
+
 
 def test_add(monkeypatch):
     def mock_pinecone_db():
@@ -1,6 +1,27 @@
-import importlib.metadata
+from importlib import import_module, metadata
 
-__version__ = importlib.metadata.version("mem0ai")
+# The clients pull in every LLM, embedder and vector store dependency, so they are only
+# imported on first access (PEP 562)
+_LAZY_ATTRIBUTES = {
+    "MemoryClient": "mem0.client.main",
+    "AsyncMemoryClient": "mem0.client.main",
+    "Memory": "mem0.memory.main",
+}
 
-from mem0.client.main import MemoryClient, AsyncMemoryClient  # noqa
-from mem0.memory.main import Memory  # noqa
+__all__ = ["__version__", *_LAZY_ATTRIBUTES]
+
+
+def __getattr__(name):
+    if name == "__version__":
+        value = metadata.version("mem0ai")
+    elif name in _LAZY_ATTRIBUTES:
+        value = getattr(import_module(_LAZY_ATTRIBUTES[name]), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # Cache it on the module so later lookups skip `__getattr__`
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *__all__})
@@ -27,3 +27,17 @@ class HuggingFaceEmbedding(EmbeddingBase):
             list: The embedding vector.
         """
         return self.model.encode(text, convert_to_numpy=True).tolist()
+
+    def embed_many(self, texts, memory_action: Optional[Literal["add", "search", "update"]] = None):
+        """
+        Get the embeddings for several texts in a single batch using Hugging Face.
+
+        Args:
+            texts (list[str]): The texts to embed.
+            memory_action (optional): The type of embedding to use. Must be one of "add", "search", or "update". Defaults to None.
+        Returns:
+            list: The embedding vectors, in the order of `texts`.
+        """
+        if not texts:
+            return []
+        return self.model.encode(texts, convert_to_numpy=True).tolist()
@@ -1,3 +1,5 @@
+import functools
+
 UPDATE_GRAPH_PROMPT = """
 You are an AI expert specializing in graph memory management and optimization. Your task is to analyze existing graph memories alongside new information, and update the relationships in the memory list to ensure the most accurate, current, and coherent representation of knowledge.
 
@@ -95,3 +97,10 @@ def get_delete_messages(existing_memories_string, data, user_id):
     return DELETE_RELATIONS_SYSTEM_PROMPT.replace(
         "USER_ID", user_id
     ), f"Here are the existing memories: {existing_memories_string} \n\n New Information: {data}"
+
+
+@functools.lru_cache(maxsize=256)
+def get_relations_system_prompt(user_id, custom_prompt=None):
+    """Build the relations extraction prompt once per user and custom prompt."""
+    custom_instruction = f"4. {custom_prompt}" if custom_prompt else ""
+    return EXTRACT_RELATIONS_PROMPT.replace("USER_ID", user_id).replace("CUSTOM_PROMPT", custom_instruction)
@@ -1,4 +1,7 @@
+import hashlib
 import logging
+import threading
+from collections import OrderedDict
 
 from mem0.memory.utils import format_entities
 
@@ -20,21 +23,45 @@ from mem0.graphs.tools import (
     RELATIONS_STRUCT_TOOL,
     RELATIONS_TOOL,
 )
-from mem0.graphs.utils import EXTRACT_RELATIONS_PROMPT, get_delete_messages
+from mem0.graphs.utils import get_delete_messages, get_relations_system_prompt
 from mem0.utils.factory import EmbedderFactory, LlmFactory
 
 logger = logging.getLogger(__name__)
 
+# Extra label set on every node with an embedding, so one vector index covers all entity types
+ENTITY_LABEL = "__Entity__"
+VECTOR_INDEX_NAME = "entity_embeddings"
+# The vector index is shared by all users, so more candidates are fetched than returned before
+# filtering on `user_id`. The candidates are fetched again with a larger limit while every one of
+# them is above the threshold, past the maximum the user's nodes are scanned instead.
+VECTOR_INDEX_CANDIDATES = 500
+VECTOR_INDEX_MAX_CANDIDATES = 10000
+# Number of entity extraction results kept to skip the LLM call for repeated texts
+ENTITY_CACHE_SIZE = 1024
+# Number of entity name embeddings kept, names such as the user id repeat in most calls
+EMBEDDING_CACHE_SIZE = 10000
+# Number of relations returned by `search` after BM25 reranking
+BM25_TOP_N = 5
+
+
+def _normalize_entity(name):
+    """Normalize an entity, type or relationship name the way it is stored in the graph."""
+    # `str.replace` is several times faster than `str.translate` for a single character
+    return name.lower().replace(" ", "_")
+
 
 class MemoryGraph:
-    def __init__(self, config):
+    def __init__(self, config, embedding_model=None):
         self.config = config
         self.graph = Neo4jGraph(
             self.config.graph_store.config.url,
             self.config.graph_store.config.username,
             self.config.graph_store.config.password,
         )
-        self.embedding_model = EmbedderFactory.create(self.config.embedder.provider, self.config.embedder.config)
+        # `Memory` passes its own embedder, so both share one model and HTTP connection pool
+        self.embedding_model = embedding_model or EmbedderFactory.create(
+            self.config.embedder.provider, self.config.embedder.config
+        )
 
         self.llm_provider = "openai_structured"
         if self.config.llm.provider:
@@ -45,6 +72,77 @@ class MemoryGraph:
         self.llm = LlmFactory.create(self.llm_provider, self.config.llm.config)
         self.user_id = None
         self.threshold = 0.7
+        self.use_vector_index = self._create_vector_index()
+        self.use_vector_property = self.use_vector_index and self._supports_vector_property()
+        # Entity type maps by user and text digest, see `_retrieve_nodes_from_data`
+        self._entity_cache = OrderedDict()
+        self._entity_cache_lock = threading.Lock()
+        # Embeddings by normalized entity name, see `_embed_many`
+        self._embedding_cache = OrderedDict()
+        self._embedding_cache_lock = threading.Lock()
+
+    def _create_vector_index(self):
+        """
+        Create the vector index used for similarity search. Needs Neo4j 5.11 or newer and known
+        embedding dimensions, otherwise similarity is computed by scanning the nodes.
+
+        Returns:
+            bool: Whether the vector index can be used.
+        """
+        embedding_dims = self.embedding_model.config.embedding_dims
+        if not embedding_dims:
+            logger.info("Embedding dimensions are not set, graph similarity search will scan all nodes")
+            return False
+
+        try:
+            existing = self.graph.query(
+                "SHOW INDEXES YIELD name WHERE name = $name RETURN count(*) AS count",
+                params={"name": VECTOR_INDEX_NAME},
+            )
+            if existing and existing[0]["count"]:
+                return True
+
+            self.graph.query(
+                f"""
+                CREATE VECTOR INDEX {VECTOR_INDEX_NAME} IF NOT EXISTS
+                FOR (n:{ENTITY_LABEL}) ON n.embedding
+                OPTIONS {{indexConfig: {{
+                    `vector.dimensions`: {int(embedding_dims)},
+                    `vector.similarity_function`: 'cosine'
+                }}}}
+                """
+            )
+            # Nodes created before the index existed do not have the label yet, this scans the whole
+            # graph so it only runs when the index is created
+            self.graph.query(
+                f"""
+                MATCH (n)
+                WHERE n.embedding IS NOT NULL AND NOT n:{ENTITY_LABEL}
+                SET n:{ENTITY_LABEL}
+                """
+            )
+        except Exception as e:
+            logger.warning(f"Could not create the vector index, graph similarity search will scan all nodes: {e}")
+            return False
+        return True
+
+    def _supports_vector_property(self):
+        """Whether embeddings can be stored as float32 arrays, available since Neo4j 5.13."""
+        try:
+            result = self.graph.query(
+                "SHOW PROCEDURES YIELD name WHERE name = 'db.create.setNodeVectorProperty' RETURN count(*) AS count"
+            )
+        except Exception as e:
+            logger.debug(f"Could not list the graph procedures: {e}")
+            return False
+        return bool(result and result[0]["count"])
+
+    def _set_embedding_clause(self, node, embedding):
+        """Cypher clause setting the embedding of `node`, in a subquery where `row` is in scope."""
+        if self.use_vector_property:
+            # A float32 array takes half the space of the list of float64 a plain SET stores
+            return f"WITH {node}, row CALL db.create.setNodeVectorProperty({node}, 'embedding', {embedding})"
+        return f"SET {node}.embedding = {embedding}"
 
     def add(self, data, filters):
         """
@@ -55,14 +153,27 @@ class MemoryGraph:
             filters (dict): A dictionary containing filters to be applied during the addition.
         """
         entity_type_map = self._retrieve_nodes_from_data(data, filters)
+        if not entity_type_map and not self.config.graph_store.custom_prompt:
+            # Relations are only extracted among the entities found, and there are no similar nodes to update
+            logger.debug("No entities found in the data, nothing to add to the graph")
+            return {"deleted_entities": [], "added_entities": []}
+
         to_be_added = self._establish_nodes_relations_from_data(data, filters, entity_type_map)
-        search_output = self._search_graph_db(node_list=list(entity_type_map.keys()), filters=filters)
-        to_be_deleted = self._get_delete_entities_from_search_output(search_output, data, filters)
+        # Without a vector index the user's nodes are fetched once for both similarity searches. Deleting
+        # relations leaves the nodes in place, so they are still current when the entities are added.
+        user_nodes = None if self.use_vector_index else self._get_user_nodes(filters["user_id"])
+        search_output = self._search_graph_db(
+            node_list=list(entity_type_map.keys()), filters=filters, user_nodes=user_nodes
+        )
+        # Without existing relations there is nothing the LLM could delete
+        to_be_deleted = []
+        if search_output:
+            to_be_deleted = self._get_delete_entities_from_search_output(search_output, data, filters)
 
         # TODO: Batch queries with APOC plugin
         # TODO: Add more filter support
         deleted_entities = self._delete_entities(to_be_deleted, filters["user_id"])
-        added_entities = self._add_entities(to_be_added, filters["user_id"], entity_type_map)
+        added_entities = self._add_entities(to_be_added, filters["user_id"], entity_type_map, user_nodes)
 
         return {"deleted_entities": deleted_entities, "added_entities": added_entities}
 
@@ -89,10 +200,14 @@ class MemoryGraph:
         search_outputs_sequence = [
             [item["source"], item["relatationship"], item["destination"]] for item in search_output
         ]
-        bm25 = BM25Okapi(search_outputs_sequence)
+        if len(search_outputs_sequence) <= BM25_TOP_N:
+            # Every result is returned anyway, keep the similarity order instead of building a BM25 index
+            reranked_results = search_outputs_sequence
+        else:
+            bm25 = BM25Okapi(search_outputs_sequence)
 
-        tokenized_query = query.split(" ")
-        reranked_results = bm25.get_top_n(tokenized_query, search_outputs_sequence, n=5)
+            tokenized_query = query.split(" ")
+            reranked_results = bm25.get_top_n(tokenized_query, search_outputs_sequence, n=BM25_TOP_N)
 
         search_results = []
         for item in reranked_results:
@@ -145,8 +260,32 @@ class MemoryGraph:
 
         return final_results
 
+    def _embed_many(self, texts):
+        """Embed entity names, reusing cached embeddings and requesting only the missing ones."""
+        with self._embedding_cache_lock:
+            cached = {text: self._embedding_cache[text] for text in texts if text in self._embedding_cache}
+            for text in cached:
+                self._embedding_cache.move_to_end(text)
+
+        missing = [text for text in dict.fromkeys(texts) if text not in cached]
+        if missing:
+            embeddings = self.embedding_model.embed_many(missing)
+            cached.update(zip(missing, embeddings))
+            with self._embedding_cache_lock:
+                self._embedding_cache.update(zip(missing, embeddings))
+                while len(self._embedding_cache) > EMBEDDING_CACHE_SIZE:
+                    self._embedding_cache.popitem(last=False)
+        return [cached[text] for text in texts]
+
     def _retrieve_nodes_from_data(self, data, filters):
         """Extracts all the entities mentioned in the query."""
+        # The same text is often extracted twice, once by `add` and again by a later `search`
+        cache_key = (filters["user_id"], hashlib.blake2b(data.encode("utf-8"), digest_size=16).digest())
+        with self._entity_cache_lock:
+            if cache_key in self._entity_cache:
+                self._entity_cache.move_to_end(cache_key)
+                return dict(self._entity_cache[cache_key])
+
         _tools = [EXTRACT_ENTITIES_TOOL]
         if self.llm_provider in ["azure_openai_structured", "openai_structured"]:
             _tools = [EXTRACT_ENTITIES_STRUCT_TOOL]
@@ -165,32 +304,32 @@ class MemoryGraph:
 
         try:
             for item in search_results["tool_calls"][0]["arguments"]["entities"]:
-                entity_type_map[item["entity"]] = item["entity_type"]
+                entity_type_map[_normalize_entity(item["entity"])] = _normalize_entity(item["entity_type"])
         except Exception as e:
             logger.error(f"Error in search tool: {e}")
+            cache_key = None
 
-        entity_type_map = {k.lower().replace(" ", "_"): v.lower().replace(" ", "_") for k, v in entity_type_map.items()}
         logger.debug(f"Entity type map: {entity_type_map}")
+
+        # Failed extractions are not cached so they are retried
+        if cache_key is not None:
+            with self._entity_cache_lock:
+                self._entity_cache[cache_key] = dict(entity_type_map)
+                while len(self._entity_cache) > ENTITY_CACHE_SIZE:
+                    self._entity_cache.popitem(last=False)
         return entity_type_map
 
     def _establish_nodes_relations_from_data(self, data, filters, entity_type_map):
         """Eshtablish relations among the extracted nodes."""
+        system_prompt = get_relations_system_prompt(filters["user_id"], self.config.graph_store.custom_prompt)
         if self.config.graph_store.custom_prompt:
             messages = [
-                {
-                    "role": "system",
-                    "content": EXTRACT_RELATIONS_PROMPT.replace("USER_ID", filters["user_id"]).replace(
-                        "CUSTOM_PROMPT", f"4. {self.config.graph_store.custom_prompt}"
-                    ),
-                },
+                {"role": "system", "content": system_prompt},
                 {"role": "user", "content": data},
             ]
         else:
             messages = [
-                {
-                    "role": "system",
-                    "content": EXTRACT_RELATIONS_PROMPT.replace("USER_ID", filters["user_id"]),
-                },
+                {"role": "system", "content": system_prompt},
                 {"role": "user", "content": f"List of entities: {list(entity_type_map.keys())}. \n\nText: {data}"},
             ]
 
@@ -212,46 +351,173 @@ class MemoryGraph:
         logger.debug(f"Extracted entities: {extracted_entities}")
         return extracted_entities
 
-    def _search_graph_db(self, node_list, filters, limit=100):
+    def _search_graph_db(self, node_list, filters, limit=100, user_nodes=None):
         """Search similar nodes among and their respective incoming and outgoing relations."""
-        result_relations = []
+        if not node_list:
+            return []
 
-        for node in node_list:
-            n_embedding = self.embedding_model.embed(node)
+        # One embedding request for all nodes instead of one per node
+        node_embeddings = self._embed_many(node_list)
+        matches = self._find_similar_nodes(node_embeddings, filters["user_id"], self.threshold, user_nodes)
+        if not any(matches):
+            return []
 
-            cypher_query = """
-            MATCH (n)
-            WHERE n.embedding IS NOT NULL AND n.user_id = $user_id
-            WITH n,
-                round(reduce(dot = 0.0, i IN range(0, size(n.embedding)-1) | dot + n.embedding[i] * $n_embedding[i]) /
-                (sqrt(reduce(l2 = 0.0, i IN range(0, size(n.embedding)-1) | l2 + n.embedding[i] * n.embedding[i])) *
-                sqrt(reduce(l2 = 0.0, i IN range(0, size($n_embedding)-1) | l2 + $n_embedding[i] * $n_embedding[i]))), 4) AS similarity
-            WHERE similarity >= $threshold
-            MATCH (n)-[r]->(m)
-            RETURN n.name AS source, elementId(n) AS source_id, type(r) AS relatationship, elementId(r) AS relation_id, m.name AS destination, elementId(m) AS destination_id, similarity
-            UNION
+        # The similar nodes of every searched node are expanded in a single round-trip, `limit`
+        # still applies to each searched node
+        cypher_query = """
+        UNWIND $matches AS query_matches
+        CALL {
+            WITH query_matches
+            UNWIND query_matches AS similar
             MATCH (n)
-            WHERE n.embedding IS NOT NULL AND n.user_id = $user_id
-            WITH n,
-                round(reduce(dot = 0.0, i IN range(0, size(n.embedding)-1) | dot + n.embedding[i] * $n_embedding[i]) /
-                (sqrt(reduce(l2 = 0.0, i IN range(0, size(n.embedding)-1) | l2 + n.embedding[i] * n.embedding[i])) *
-                sqrt(reduce(l2 = 0.0, i IN range(0, size($n_embedding)-1) | l2 + $n_embedding[i] * $n_embedding[i]))), 4) AS similarity
-            WHERE similarity >= $threshold
-            MATCH (m)-[r]->(n)
-            RETURN m.name AS source, elementId(m) AS source_id, type(r) AS relatationship, elementId(r) AS relation_id, n.name AS destination, elementId(n) AS destination_id, similarity
+            WHERE elementId(n) = similar.node_id
+            WITH n, similar.similarity AS similarity
+            CALL {
+                WITH n
+                MATCH (n)-[r]->(m)
+                RETURN n.name AS source, elementId(n) AS source_id, type(r) AS relatationship, elementId(r) AS relation_id, m.name AS destination, elementId(m) AS destination_id
+                UNION
+                WITH n
+                MATCH (m)-[r]->(n)
+                RETURN m.name AS source, elementId(m) AS source_id, type(r) AS relatationship, elementId(r) AS relation_id, n.name AS destination, elementId(n) AS destination_id
+            }
+            RETURN source, source_id, relatationship, relation_id, destination, destination_id, similarity
             ORDER BY similarity DESC
             LIMIT $limit
-            """
-            params = {
-                "n_embedding": n_embedding,
-                "threshold": self.threshold,
-                "user_id": filters["user_id"],
-                "limit": limit,
+        }
+        RETURN source, source_id, relatationship, relation_id, destination, destination_id, similarity
+        """
+        params = {
+            "matches": matches,
+            "limit": limit,
+        }
+        return self.graph.query(cypher_query, params=params)
+
+    def _find_similar_nodes(self, embeddings, user_id, threshold, user_nodes=None):
+        """
+        Find the nodes of the user similar to each embedding. Without a vector index, `user_nodes`
+        saves fetching the user's nodes again when they were already fetched by the caller.
+
+        Returns:
+            list: For each embedding, the `{"node_id", "similarity"}` of the nodes with a similarity of at
+                least `threshold`, most similar first.
+        """
+        matches = [[] for _ in embeddings]
+        remaining = list(range(len(embeddings)))
+        candidates = VECTOR_INDEX_CANDIDATES
+        while self.use_vector_index and remaining:
+            saturated = []
+            for position, query_matches, is_saturated in self._query_vector_index(
+                [embeddings[i] for i in remaining], user_id, threshold, candidates
+            ):
+                if is_saturated:
+                    # Nodes of the user may be ranked below the candidates returned
+                    saturated.append(remaining[position])
+                else:
+                    matches[remaining[position]] = query_matches
+            remaining = saturated
+            if candidates >= VECTOR_INDEX_MAX_CANDIDATES:
+                break
+            candidates = min(candidates * 4, VECTOR_INDEX_MAX_CANDIDATES)
+
+        if remaining:
+            # Only needed without a vector index, numpy comes with the vector store clients
+            import numpy as np
+
+            if user_nodes is None:
+                user_nodes = self._get_user_nodes(user_id)
+            node_ids, similarities = self._compute_similarities([embeddings[i] for i in remaining], user_nodes)
+            for i, query_similarities in zip(remaining, similarities):
+                above_threshold = np.flatnonzero(query_similarities >= threshold)
+                matches[i] = [
+                    {"node_id": node_ids[j], "similarity": float(query_similarities[j])}
+                    for j in above_threshold[np.argsort(-query_similarities[above_threshold], kind="stable")]
+                ]
+        return matches
+
+    def _query_vector_index(self, embeddings, user_id, threshold, candidates):
+        """
+        Query the vector index for the nodes of the user similar to each embedding.
+
+        Returns:
+            list: `(index, matches, saturated)` tuples, where `saturated` tells that all `candidates`
+                were above `threshold` so more similar nodes of the user may not have been returned.
+        """
+        # The index scores cosine similarity as (1 + cos) / 2, it is mapped back to cos
+        cypher = """
+            UNWIND range(0, size($embeddings) - 1) AS i
+            CALL {
+                WITH i
+                CALL db.index.vector.queryNodes($index_name, $candidates, $embeddings[i])
+                YIELD node, score
+                WITH node, round(2 * score - 1, 4) AS similarity
+                RETURN
+                    collect(
+                        CASE WHEN node.user_id = $user_id AND similarity >= $threshold
+                        THEN {node_id: elementId(node), similarity: similarity} END
+                    ) AS matches,
+                    count(*) = $candidates AND min(similarity) >= $threshold AS saturated
             }
-            ans = self.graph.query(cypher_query, params=params)
-            result_relations.extend(ans)
+            RETURN i, matches, saturated
+            """
+        params = {
+            "index_name": VECTOR_INDEX_NAME,
+            "candidates": candidates,
+            "embeddings": embeddings,
+            "user_id": user_id,
+            "threshold": threshold,
+        }
+        return [
+            (row["i"], sorted(row["matches"], key=lambda match: -match["similarity"]), row["saturated"])
+            for row in self.graph.query(cypher, params=params)
+        ]
+
+    def _get_user_nodes(self, user_id):
+        """
+        Fetch the embeddings of every node of the user, used to compute similarities without a vector index.
+
+        Returns:
+            tuple: The node element ids and their embeddings as a matrix of unit rows.
+        """
+        cypher = """
+            MATCH (n)
+            WHERE n.embedding IS NOT NULL AND n.user_id = $user_id
+            RETURN elementId(n) AS node_id, n.embedding AS embedding
+            """
+        import numpy as np
+
+        rows = self.graph.query(cypher, params={"user_id": user_id})
+        node_ids = [row["node_id"] for row in rows]
+        if not rows:
+            return node_ids, np.zeros((0, 0), dtype=np.float32)
+
+        node_matrix = np.asarray([row["embedding"] for row in rows], dtype=np.float32)
+        # Normalize the rows so cosine similarity is a single matrix product, zero vectors stay zero
+        node_matrix /= np.maximum(np.linalg.norm(node_matrix, axis=1, keepdims=True), np.finfo(np.float32).tiny)
+        return node_ids, node_matrix
 
-        return result_relations
+    def _compute_similarities(self, embeddings, user_nodes):
+        """
+        Compute the cosine similarity of the given embeddings to every node of the user with BLAS,
+        instead of comparing the embeddings element by element in Cypher.
+
+        Args:
+            embeddings (list): The embeddings to compare.
+            user_nodes (tuple): The user's nodes, as returned by `_get_user_nodes`.
+
+        Returns:
+            tuple: The node element ids and a `(len(embeddings), len(node_ids))` similarity matrix,
+                rounded to 4 decimals like the similarities computed by the graph.
+        """
+        import numpy as np
+
+        node_ids, node_matrix = user_nodes
+        if not node_ids or not len(embeddings):
+            return node_ids, np.zeros((len(embeddings), len(node_ids)), dtype=np.float32)
+
+        query_matrix = np.asarray(embeddings, dtype=np.float32)
+        query_matrix /= np.maximum(np.linalg.norm(query_matrix, axis=1, keepdims=True), np.finfo(np.float32).tiny)
+        return node_ids, np.round(query_matrix @ node_matrix.T, 4)
 
     def _get_delete_entities_from_search_output(self, search_output, data, filters):
         """Get the entities to be deleted from the search output."""
@@ -282,35 +548,53 @@ class MemoryGraph:
 
     def _delete_entities(self, to_be_deleted, user_id):
         """Delete the entities from the graph."""
-        results = []
-        for item in to_be_deleted:
-            source = item["source"]
-            destination = item["destination"]
-            relatationship = item["relationship"]
+        # One result list per item, filled from a single query per relationship type
+        results = [[] for _ in to_be_deleted]
+        groups = {}
+        for index, item in enumerate(to_be_deleted):
+            groups.setdefault(item["relationship"], []).append(
+                {"index": index, "source_name": item["source"], "dest_name": item["destination"]}
+            )
 
-            # Delete the specific relationship between nodes
+        for relatationship, rows in groups.items():
+            # Delete the specific relationships between nodes
             cypher = f"""
-            MATCH (n {{name: $source_name, user_id: $user_id}})
+            UNWIND $rows AS row
+            MATCH (n {{name: row.source_name, user_id: $user_id}})
             -[r:{relatationship}]->
-            (m {{name: $dest_name, user_id: $user_id}})
+            (m {{name: row.dest_name, user_id: $user_id}})
             DELETE r
-            RETURN 
+            RETURN
+                row.index AS index,
                 n.name AS source,
                 m.name AS target,
                 type(r) AS relationship
             """
             params = {
-                "source_name": source,
-                "dest_name": destination,
+                "rows": rows,
                 "user_id": user_id,
             }
-            result = self.graph.query(cypher, params=params)
-            results.append(result)
+            for result in self.graph.query(cypher, params=params):
+                index = result.pop("index")
+                results[index].append(result)
         return results
 
-    def _add_entities(self, to_be_added, user_id, entity_type_map):
+    def _add_entities(self, to_be_added, user_id, entity_type_map, user_nodes=None):
         """Add the new entities to the graph. Merge the nodes if they already exist."""
         results = []
+        # Embed every distinct entity with a single request
+        entity_names = list(
+            dict.fromkeys(name for item in to_be_added for name in (item["source"], item["destination"]))
+        )
+        entity_embeddings = dict(zip(entity_names, self._embed_many(entity_names)))
+
+        # search for the nodes with the closest embeddings
+        node_ids = self._search_nodes(
+            entity_names, [entity_embeddings[name] for name in entity_names], user_id, user_nodes=user_nodes
+        )
+
+        # Labels and relationship types can not be parameters, so one query is sent per combination
+        groups = {}
         for item in to_be_added:
             # entities
             source = item["source"]
@@ -321,179 +605,80 @@ class MemoryGraph:
             source_type = entity_type_map.get(source, "unknown")
             destination_type = entity_type_map.get(destination, "unknown")
 
-            # embeddings
-            source_embedding = self.embedding_model.embed(source)
-            dest_embedding = self.embedding_model.embed(destination)
-
-            # search for the nodes with the closest embeddings
-            source_node_search_result = self._search_source_node(source_embedding, user_id, threshold=0.9)
-            destination_node_search_result = self._search_destination_node(dest_embedding, user_id, threshold=0.9)
-
-            # TODO: Create a cypher query and common params for all the cases
-            if not destination_node_search_result and source_node_search_result:
-                cypher = f"""
-                    MATCH (source)
-                    WHERE elementId(source) = $source_id
-                    MERGE (destination:{destination_type} {{name: $destination_name, user_id: $user_id}})
-                    ON CREATE SET
-                        destination.created = timestamp(),
-                        destination.embedding = $destination_embedding
-                    MERGE (source)-[r:{relationship}]->(destination)
-                    ON CREATE SET 
-                        r.created = timestamp()
-                    RETURN source.name AS source, type(r) AS relationship, destination.name AS target
-                    """
-
-                params = {
-                    "source_id": source_node_search_result[0]["elementId(source_candidate)"],
-                    "destination_name": destination,
-                    "relationship": relationship,
-                    "destination_type": destination_type,
-                    "destination_embedding": dest_embedding,
-                    "user_id": user_id,
-                }
-                resp = self.graph.query(cypher, params=params)
-                results.append(resp)
-
-            elif destination_node_search_result and not source_node_search_result:
-                cypher = f"""
-                    MATCH (destination)
-                    WHERE elementId(destination) = $destination_id
-                    MERGE (source:{source_type} {{name: $source_name, user_id: $user_id}})
-                    ON CREATE SET
-                        source.created = timestamp(),
-                        source.embedding = $source_embedding
-                    MERGE (source)-[r:{relationship}]->(destination)
-                    ON CREATE SET 
-                        r.created = timestamp()
-                    RETURN source.name AS source, type(r) AS relationship, destination.name AS target
-                    """
-
-                params = {
-                    "destination_id": destination_node_search_result[0]["elementId(destination_candidate)"],
+            groups.setdefault((source_type, destination_type, relationship), []).append(
+                {
                     "source_name": source,
-                    "relationship": relationship,
-                    "source_type": source_type,
-                    "source_embedding": source_embedding,
-                    "user_id": user_id,
+                    "source_id": node_ids.get(source),
+                    "source_embedding": entity_embeddings[source],
+                    "dest_name": destination,
+                    "destination_id": node_ids.get(destination),
+                    "dest_embedding": entity_embeddings[destination],
                 }
-                resp = self.graph.query(cypher, params=params)
-                results.append(resp)
+            )
 
-            elif source_node_search_result and destination_node_search_result:
-                cypher = f"""
+        for (source_type, destination_type, relationship), rows in groups.items():
+            # Each node is either the similar node found above or merged by name
+            cypher = f"""
+                UNWIND $rows AS row
+                CALL {{
+                    WITH row
+                    WITH row WHERE row.source_id IS NOT NULL
                     MATCH (source)
-                    WHERE elementId(source) = $source_id
+                    WHERE elementId(source) = row.source_id
+                    RETURN source
+                    UNION
+                    WITH row
+                    WITH row WHERE row.source_id IS NULL
+                    MERGE (source:{source_type} {{name: row.source_name, user_id: $user_id}})
+                    ON CREATE SET source.created = timestamp()
+                    SET source:{ENTITY_LABEL}
+                    {self._set_embedding_clause("source", "row.source_embedding")}
+                    RETURN source
+                }}
+                CALL {{
+                    WITH row
+                    WITH row WHERE row.destination_id IS NOT NULL
                     MATCH (destination)
-                    WHERE elementId(destination) = $destination_id
-                    MERGE (source)-[r:{relationship}]->(destination)
-                    ON CREATE SET 
-                        r.created_at = timestamp(),
-                        r.updated_at = timestamp()
-                    RETURN source.name AS source, type(r) AS relationship, destination.name AS target
-                    """
-                params = {
-                    "source_id": source_node_search_result[0]["elementId(source_candidate)"],
-                    "destination_id": destination_node_search_result[0]["elementId(destination_candidate)"],
-                    "user_id": user_id,
-                    "relationship": relationship,
-                }
-                resp = self.graph.query(cypher, params=params)
-                results.append(resp)
-
-            elif not source_node_search_result and not destination_node_search_result:
-                cypher = f"""
-                    MERGE (n:{source_type} {{name: $source_name, user_id: $user_id}})
-                    ON CREATE SET n.created = timestamp(), n.embedding = $source_embedding
-                    ON MATCH SET n.embedding = $source_embedding
-                    MERGE (m:{destination_type} {{name: $dest_name, user_id: $user_id}})
-                    ON CREATE SET m.created = timestamp(), m.embedding = $dest_embedding
-                    ON MATCH SET m.embedding = $dest_embedding
-                    MERGE (n)-[rel:{relationship}]->(m)
-                    ON CREATE SET rel.created = timestamp()
-                    RETURN n.name AS source, type(rel) AS relationship, m.name AS target
-                    """
-                params = {
-                    "source_name": source,
-                    "source_type": source_type,
-                    "dest_name": destination,
-                    "destination_type": destination_type,
-                    "source_embedding": source_embedding,
-                    "dest_embedding": dest_embedding,
-                    "user_id": user_id,
-                }
-                resp = self.graph.query(cypher, params=params)
-                results.append(resp)
+                    WHERE elementId(destination) = row.destination_id
+                    RETURN destination
+                    UNION
+                    WITH row
+                    WITH row WHERE row.destination_id IS NULL
+                    MERGE (destination:{destination_type} {{name: row.dest_name, user_id: $user_id}})
+                    ON CREATE SET destination.created = timestamp()
+                    SET destination:{ENTITY_LABEL}
+                    {self._set_embedding_clause("destination", "row.dest_embedding")}
+                    RETURN destination
+                }}
+                MERGE (source)-[r:{relationship}]->(destination)
+                ON CREATE SET r.created = timestamp()
+                RETURN source.name AS source, type(r) AS relationship, destination.name AS target
+                """
+            params = {
+                "rows": rows,
+                "user_id": user_id,
+            }
+            resp = self.graph.query(cypher, params=params)
+            # One result list per added relation, as when every relation had its own query
+            results.extend([relation] for relation in resp)
         return results
 
     def _remove_spaces_from_entities(self, entity_list):
         for item in entity_list:
-            item["source"] = item["source"].lower().replace(" ", "_")
-            item["relationship"] = item["relationship"].lower().replace(" ", "_")
-            item["destination"] = item["destination"].lower().replace(" ", "_")
+            item["source"] = _normalize_entity(item["source"])
+            item["relationship"] = _normalize_entity(item["relationship"])
+            item["destination"] = _normalize_entity(item["destination"])
         return entity_list
 
-    def _search_source_node(self, source_embedding, user_id, threshold=0.9):
-        cypher = """
-            MATCH (source_candidate)
-            WHERE source_candidate.embedding IS NOT NULL 
-            AND source_candidate.user_id = $user_id
-
-            WITH source_candidate,
-                round(
-                    reduce(dot = 0.0, i IN range(0, size(source_candidate.embedding)-1) |
-                        dot + source_candidate.embedding[i] * $source_embedding[i]) /
-                    (sqrt(reduce(l2 = 0.0, i IN range(0, size(source_candidate.embedding)-1) |
-                        l2 + source_candidate.embedding[i] * source_candidate.embedding[i])) *
-                    sqrt(reduce(l2 = 0.0, i IN range(0, size($source_embedding)-1) |
-                        l2 + $source_embedding[i] * $source_embedding[i])))
-                , 4) AS source_similarity
-            WHERE source_similarity >= $threshold
-
-            WITH source_candidate, source_similarity
-            ORDER BY source_similarity DESC
-            LIMIT 1
-
-            RETURN elementId(source_candidate)
-            """
-
-        params = {
-            "source_embedding": source_embedding,
-            "user_id": user_id,
-            "threshold": threshold,
-        }
-
-        result = self.graph.query(cypher, params=params)
-        return result
+    def _search_nodes(self, names, embeddings, user_id, threshold=0.9, user_nodes=None):
+        """
+        Find the closest existing node of the user for each entity.
 
-    def _search_destination_node(self, destination_embedding, user_id, threshold=0.9):
-        cypher = """
-            MATCH (destination_candidate)
-            WHERE destination_candidate.embedding IS NOT NULL 
-            AND destination_candidate.user_id = $user_id
-
-            WITH destination_candidate,
-                round(
-                    reduce(dot = 0.0, i IN range(0, size(destination_candidate.embedding)-1) |
-                        dot + destination_candidate.embedding[i] * $destination_embedding[i]) /
-                    (sqrt(reduce(l2 = 0.0, i IN range(0, size(destination_candidate.embedding)-1) |
-                        l2 + destination_candidate.embedding[i] * destination_candidate.embedding[i])) *
-                    sqrt(reduce(l2 = 0.0, i IN range(0, size($destination_embedding)-1) |
-                        l2 + $destination_embedding[i] * $destination_embedding[i])))
-                , 4) AS destination_similarity
-            WHERE destination_similarity >= $threshold
-
-            WITH destination_candidate, destination_similarity
-            ORDER BY destination_similarity DESC
-            LIMIT 1
-
-            RETURN elementId(destination_candidate)
-            """
-        params = {
-            "destination_embedding": destination_embedding,
-            "user_id": user_id,
-            "threshold": threshold,
-        }
+        Returns:
+            dict: The element id of the closest node by entity name, for the entities with a node above `threshold`.
+        """
+        if not names:
+            return {}
 
-        result = self.graph.query(cypher, params=params)
-        return result
+        matches = self._find_similar_nodes(embeddings, user_id, threshold, user_nodes)
+        return {name: node_matches[0]["node_id"] for name, node_matches in zip(names, matches) if node_matches}
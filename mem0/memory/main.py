@@ -49,7 +49,7 @@ class Memory(MemoryBase):
         if self.api_version == "v1.1" and self.config.graph_store.config:
             from mem0.memory.graph_memory import MemoryGraph
 
-            self.graph = MemoryGraph(self.config)
+            self.graph = MemoryGraph(self.config, embedding_model=self.embedding_model)
             self.enable_graph = True
 
         capture_event("mem0.init", self)
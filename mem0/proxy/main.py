@@ -1,7 +1,9 @@
+import functools
 import logging
 import subprocess
 import sys
 import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import List, Optional, Union
 
 import httpx
@@ -30,6 +32,12 @@ from mem0.memory.telemetry import capture_client_event
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=256)
+def _supports_function_calling(model: str) -> bool:
+    # Looked up in litellm's model registry, which does not change while the process runs
+    return litellm.supports_function_calling(model)
+
+
 class Mem0:
     def __init__(
         self,
@@ -44,6 +52,10 @@ class Mem0:
 
         self.chat = Chat(self.mem0_client)
 
+    def close(self):
+        """Wait for the memories still being added in the background, then stop the worker threads."""
+        self.chat.completions.close()
+
 
 class Chat:
     def __init__(self, mem0_client):
@@ -51,8 +63,21 @@ class Chat:
 
 
 class Completions:
+    # Background memory adds that may be queued or running at once, `create` blocks until one finishes
+    MAX_PENDING_ADDS = 64
+
     def __init__(self, mem0_client):
         self.mem0_client = mem0_client
+        # Runs the memory search while the messages for the LLM are being prepared
+        self._search_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="mem0-search")
+        # Bounded pool for the background memory adds instead of a new thread per request
+        self._add_executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix="mem0-add")
+        self._add_slots = threading.BoundedSemaphore(self.MAX_PENDING_ADDS)
+
+    def close(self):
+        """Wait for the memories still being added in the background, then stop the worker threads."""
+        self._add_executor.shutdown(wait=True)
+        self._search_executor.shutdown(wait=True)
 
     def create(
         self,
@@ -100,17 +125,27 @@ class Completions:
         if not any([user_id, agent_id, run_id]):
             raise ValueError("One of user_id, agent_id, run_id must be provided")
 
-        if not litellm.supports_function_calling(model):
+        if not _supports_function_calling(model):
             raise ValueError(
                 f"Model '{model}' does not support function calling. Please use a model that supports function calling."
             )
 
+        search_future = None
+        if messages and messages[-1]["role"] == "user":
+            search_future = self._search_executor.submit(
+                self._fetch_relevant_memories, messages, user_id, agent_id, run_id, filters, limit
+            )
+
         prepared_messages = self._prepare_messages(messages)
-        if prepared_messages[-1]["role"] == "user":
+        if search_future is not None:
             self._async_add_to_memory(messages, user_id, agent_id, run_id, metadata, filters)
-            relevant_memories = self._fetch_relevant_memories(messages, user_id, agent_id, run_id, filters, limit)
+            relevant_memories = search_future.result()
             logger.debug(f"Retrieved {len(relevant_memories)} relevant memories")
-            prepared_messages[-1]["content"] = self._format_query_with_memories(messages, relevant_memories)
+            # Replace the last message instead of editing it, the caller's dict is also added to memory
+            prepared_messages[-1] = {
+                **prepared_messages[-1],
+                "content": self._format_query_with_memories(messages, relevant_memories),
+            }
 
         response = litellm.completion(
             model=model,
@@ -147,9 +182,10 @@ class Completions:
         return response
 
     def _prepare_messages(self, messages: List[dict]) -> List[dict]:
+        # Always a new list, so the caller's list is left untouched
         if not messages or messages[0]["role"] != "system":
-            return [{"role": "system", "content": MEMORY_ANSWER_PROMPT}] + messages
-        return messages
+            return [{"role": "system", "content": MEMORY_ANSWER_PROMPT}, *messages]
+        return [*messages]
 
     def _async_add_to_memory(self, messages, user_id, agent_id, run_id, metadata, filters):
         def add_task():
@@ -163,11 +199,24 @@ class Completions:
                 filters=filters,
             )
 
-        threading.Thread(target=add_task, daemon=True).start()
+        # Without a bound, adds slower than the incoming requests would pile up in the executor's queue
+        self._add_slots.acquire()
+        try:
+            future = self._add_executor.submit(add_task)
+        except BaseException:
+            self._add_slots.release()
+            raise
+        future.add_done_callback(self._on_add_done)
+
+    def _on_add_done(self, future: Future):
+        self._add_slots.release()
+        # Nobody waits on the future, so a failed add would otherwise go unnoticed
+        if not future.cancelled() and future.exception() is not None:
+            logger.error("Error occurred while adding to memory", exc_info=future.exception())
 
     def _fetch_relevant_memories(self, messages, user_id, agent_id, run_id, filters, limit):
         # Currently, only pass the last 6 messages to the search API to prevent long query
-        message_input = [f"{message['role']}: {message['content']}" for message in messages][-6:]
+        message_input = [f"{message['role']}: {message['content']}" for message in messages[-6:]]
         # TODO: Make it better by summarizing the past conversation
         return self.mem0_client.search(
             query="\n".join(message_input),
@@ -82,3 +82,17 @@ def test_embed_uses_environment_api_key(mock_openai_client, monkeypatch):
         input=["Environment key test"], model="text-embedding-3-small"
     )
     assert result == [1.3, 1.4, 1.5]
+
+
+def test_embed_many_uses_single_request(mock_openai_client):
+    embedder = OpenAIEmbedding(BaseEmbedderConfig())
+    mock_response = Mock()
+    mock_response.data = [Mock(embedding=[0.1, 0.2]), Mock(embedding=[0.3, 0.4])]
+    mock_openai_client.embeddings.create.return_value = mock_response
+
+    result = embedder.embed_many(["Hello\nworld", "Test"])
+
+    mock_openai_client.embeddings.create.assert_called_once_with(
+        input=["Hello world", "Test"], model="text-embedding-3-small"
+    )
+    assert result == [[0.1, 0.2], [0.3, 0.4]]
@@ -0,0 +1,411 @@
+import os
+import uuid
+from unittest.mock import Mock, patch
+
+import pytest
+
+from mem0.memory.graph_memory import VECTOR_INDEX_CANDIDATES, VECTOR_INDEX_MAX_CANDIDATES, MemoryGraph
+
+
+def make_query(responses):
+    """Build a `Neo4jGraph.query` side effect answering each query by the first marker it contains."""
+
+    def query(cypher, params=None):
+        for marker, response in responses.items():
+            if marker in cypher:
+                return response(params) if callable(response) else response
+        return []
+
+    return query
+
+
+def queries_containing(graph, marker):
+    return [call for call in graph.query.call_args_list if marker in call.args[0]]
+
+
+@pytest.fixture
+def config():
+    config = Mock()
+    config.llm.provider = "openai_structured"
+    config.graph_store.llm = None
+    config.graph_store.custom_prompt = None
+    return config
+
+
+@pytest.fixture
+def embedding_model():
+    embedding_model = Mock()
+    embedding_model.config.embedding_dims = 3
+    return embedding_model
+
+
+@pytest.fixture
+def mock_graph():
+    with patch("mem0.memory.graph_memory.Neo4jGraph") as mock_neo4j, patch(
+        "mem0.memory.graph_memory.LlmFactory"
+    ), patch("mem0.memory.graph_memory.EmbedderFactory"):
+        graph = mock_neo4j.return_value
+        graph.query.side_effect = make_query({"SHOW INDEXES": [{"count": 1}], "SHOW PROCEDURES": [{"count": 1}]})
+        yield graph
+
+
+def test_create_vector_index(config, embedding_model, mock_graph):
+    mock_graph.query.side_effect = make_query({"SHOW INDEXES": [{"count": 0}], "SHOW PROCEDURES": [{"count": 0}]})
+
+    memory_graph = MemoryGraph(config, embedding_model)
+
+    assert memory_graph.use_vector_index
+    assert not memory_graph.use_vector_property
+    create_queries = queries_containing(mock_graph, "CREATE VECTOR INDEX")
+    assert len(create_queries) == 1
+    assert "`vector.dimensions`: 3" in create_queries[0].args[0]
+    # Nodes created before the index are labeled once
+    assert len(queries_containing(mock_graph, "SET n:__Entity__")) == 1
+
+
+def test_existing_vector_index_skips_backfill(config, embedding_model, mock_graph):
+    memory_graph = MemoryGraph(config, embedding_model)
+
+    assert memory_graph.use_vector_index
+    assert memory_graph.use_vector_property
+    assert not queries_containing(mock_graph, "CREATE VECTOR INDEX")
+    assert not queries_containing(mock_graph, "SET n:__Entity__")
+
+
+def test_vector_index_needs_embedding_dims(config, embedding_model, mock_graph):
+    embedding_model.config.embedding_dims = None
+
+    memory_graph = MemoryGraph(config, embedding_model)
+
+    assert not memory_graph.use_vector_index
+    assert not memory_graph.use_vector_property
+    mock_graph.query.assert_not_called()
+
+
+def test_vector_index_creation_failure(config, embedding_model, mock_graph):
+    mock_graph.query.side_effect = Exception("Unsupported")
+
+    memory_graph = MemoryGraph(config, embedding_model)
+
+    assert not memory_graph.use_vector_index
+
+
+def test_find_similar_nodes_with_vector_index(config, embedding_model, mock_graph):
+    memory_graph = MemoryGraph(config, embedding_model)
+    mock_graph.query.side_effect = make_query(
+        {
+            "db.index.vector.queryNodes": [
+                {
+                    "i": 0,
+                    "matches": [{"node_id": "a", "similarity": 0.8}, {"node_id": "b", "similarity": 0.9}],
+                    "saturated": False,
+                },
+                {"i": 1, "matches": [], "saturated": False},
+            ]
+        }
+    )
+
+    matches = memory_graph._find_similar_nodes([[1, 0, 0], [0, 1, 0]], "user", 0.7)
+
+    assert matches == [[{"node_id": "b", "similarity": 0.9}, {"node_id": "a", "similarity": 0.8}], []]
+    (query,) = queries_containing(mock_graph, "db.index.vector.queryNodes")
+    assert query.kwargs["params"]["candidates"] == VECTOR_INDEX_CANDIDATES
+    assert query.kwargs["params"]["user_id"] == "user"
+
+
+def test_find_similar_nodes_retries_saturated_candidates(config, embedding_model, mock_graph):
+    memory_graph = MemoryGraph(config, embedding_model)
+
+    def query_nodes(params):
+        # The second embedding keeps filling every candidate with nodes of other users
+        return [{"i": i, "matches": [], "saturated": True} for i in range(len(params["embeddings"]))]
+
+    mock_graph.query.side_effect = make_query(
+        {
+            "db.index.vector.queryNodes": query_nodes,
+            "RETURN elementId(n) AS node_id, n.embedding AS embedding": [
+                {"node_id": "a", "embedding": [0, 1, 0]},
+                {"node_id": "b", "embedding": [1, 1, 0]},
+            ],
+        }
+    )
+
+    matches = memory_graph._find_similar_nodes([[0, 1, 0]], "user", 0.7)
+
+    candidates = [
+        query.kwargs["params"]["candidates"] for query in queries_containing(mock_graph, "db.index.vector.queryNodes")
+    ]
+    assert candidates[0] == VECTOR_INDEX_CANDIDATES
+    assert candidates[-1] == VECTOR_INDEX_MAX_CANDIDATES
+    assert candidates == sorted(candidates)
+    # Still saturated at the maximum, so the user's nodes are compared directly
+    assert matches == [[{"node_id": "a", "similarity": 1.0}, {"node_id": "b", "similarity": pytest.approx(0.7071)}]]
+
+
+def test_find_similar_nodes_without_vector_index(config, embedding_model, mock_graph):
+    embedding_model.config.embedding_dims = None
+    memory_graph = MemoryGraph(config, embedding_model)
+    mock_graph.query.side_effect = make_query(
+        {
+            "RETURN elementId(n) AS node_id, n.embedding AS embedding": [
+                {"node_id": "a", "embedding": [1, 0, 0]},
+                {"node_id": "b", "embedding": [0, 2, 0]},
+                {"node_id": "c", "embedding": [0, 0, 0]},
+            ]
+        }
+    )
+
+    matches = memory_graph._find_similar_nodes([[0, 1, 0], [1, 0.1, 0], [0, 0, 1]], "user", 0.7)
+
+    assert matches == [
+        [{"node_id": "b", "similarity": 1.0}],
+        [{"node_id": "a", "similarity": pytest.approx(0.995)}],
+        [],
+    ]
+    assert not queries_containing(mock_graph, "db.index.vector.queryNodes")
+
+
+def test_search_graph_db_expands_similar_nodes(config, embedding_model, mock_graph):
+    embedding_model.embed_many.return_value = [[1, 0, 0]]
+    memory_graph = MemoryGraph(config, embedding_model)
+    relation = {"source": "alice", "relatationship": "likes", "destination": "pizza"}
+    mock_graph.query.side_effect = make_query(
+        {
+            "db.index.vector.queryNodes": [
+                {"i": 0, "matches": [{"node_id": "a", "similarity": 0.9}], "saturated": False}
+            ],
+            "UNWIND $matches AS query_matches": [relation],
+        }
+    )
+
+    assert memory_graph._search_graph_db(["alice"], {"user_id": "user"}) == [relation]
+    (query,) = queries_containing(mock_graph, "UNWIND $matches AS query_matches")
+    assert query.kwargs["params"] == {"matches": [[{"node_id": "a", "similarity": 0.9}]], "limit": 100}
+
+
+def test_search_graph_db_without_matches(config, embedding_model, mock_graph):
+    embedding_model.embed_many.return_value = [[1, 0, 0]]
+    memory_graph = MemoryGraph(config, embedding_model)
+    mock_graph.query.side_effect = make_query(
+        {"db.index.vector.queryNodes": [{"i": 0, "matches": [], "saturated": False}]}
+    )
+
+    assert memory_graph._search_graph_db(["alice"], {"user_id": "user"}) == []
+    assert not queries_containing(mock_graph, "UNWIND $matches AS query_matches")
+
+
+def test_add_without_vector_index_fetches_user_nodes_once(config, embedding_model, mock_graph):
+    embedding_model.config.embedding_dims = None
+    embedding_model.embed_many.side_effect = lambda texts: [[1, 0, 0] for _ in texts]
+    memory_graph = MemoryGraph(config, embedding_model)
+    memory_graph._retrieve_nodes_from_data = Mock(return_value={"alice": "person", "pizza": "food"})
+    memory_graph._establish_nodes_relations_from_data = Mock(
+        return_value=[{"source": "alice", "relationship": "likes", "destination": "pizza"}]
+    )
+    mock_graph.query.side_effect = make_query(
+        {
+            "RETURN elementId(n) AS node_id, n.embedding AS embedding": [{"node_id": "a", "embedding": [1, 0, 0]}],
+            "MERGE (source)-[r:likes]->(destination)": [
+                {"source": "alice", "relationship": "likes", "target": "pizza"}
+            ],
+        }
+    )
+
+    result = memory_graph.add("Alice likes pizza", {"user_id": "user"})
+
+    assert result == {
+        "deleted_entities": [],
+        "added_entities": [[{"source": "alice", "relationship": "likes", "target": "pizza"}]],
+    }
+    assert len(queries_containing(mock_graph, "RETURN elementId(n) AS node_id, n.embedding AS embedding")) == 1
+
+
+def test_add_entities_groups_by_types_and_relationship(config, embedding_model, mock_graph):
+    embedding_model.embed_many.side_effect = lambda texts: [[i, 1, 0] for i, _ in enumerate(texts)]
+    memory_graph = MemoryGraph(config, embedding_model)
+
+    def add_relations(relationship):
+        return lambda params: [
+            {"source": row["source_name"], "relationship": relationship, "target": row["dest_name"]}
+            for row in params["rows"]
+        ]
+
+    mock_graph.query.side_effect = make_query(
+        {
+            # Only alice already has a similar node
+            "db.index.vector.queryNodes": lambda params: [
+                {"i": i, "matches": [{"node_id": "alice-id", "similarity": 0.95}] if i == 0 else [], "saturated": False}
+                for i in range(len(params["embeddings"]))
+            ],
+            "[r:likes]": add_relations("likes"),
+            "[r:lives_in]": add_relations("lives_in"),
+        }
+    )
+    to_be_added = [
+        {"source": "alice", "relationship": "likes", "destination": "pizza"},
+        {"source": "alice", "relationship": "lives_in", "destination": "paris"},
+        {"source": "bob", "relationship": "likes", "destination": "pasta"},
+    ]
+    entity_type_map = {"alice": "person", "bob": "person", "pizza": "food", "pasta": "food", "paris": "city"}
+
+    results = memory_graph._add_entities(to_be_added, "user", entity_type_map)
+
+    # Every distinct entity is embedded with a single request
+    embedding_model.embed_many.assert_called_once_with(["alice", "pizza", "paris", "bob", "pasta"])
+    likes_query, lives_in_query = queries_containing(mock_graph, "UNWIND $rows AS row")
+    assert "MERGE (source:person" in likes_query.args[0]
+    assert "MERGE (destination:food" in likes_query.args[0]
+    assert [
+        (row["source_name"], row["source_id"], row["dest_name"], row["destination_id"])
+        for row in likes_query.kwargs["params"]["rows"]
+    ] == [("alice", "alice-id", "pizza", None), ("bob", None, "pasta", None)]
+    assert "MERGE (destination:city" in lives_in_query.args[0]
+    assert [row["source_id"] for row in lives_in_query.kwargs["params"]["rows"]] == ["alice-id"]
+    # One result list per added relation
+    assert results == [
+        [{"source": "alice", "relationship": "likes", "target": "pizza"}],
+        [{"source": "bob", "relationship": "likes", "target": "pasta"}],
+        [{"source": "alice", "relationship": "lives_in", "target": "paris"}],
+    ]
+
+
+def test_add_entities_unknown_type(config, embedding_model, mock_graph):
+    embedding_model.embed_many.side_effect = lambda texts: [[1, 0, 0] for _ in texts]
+    memory_graph = MemoryGraph(config, embedding_model)
+
+    memory_graph._add_entities([{"source": "alice", "relationship": "knows", "destination": "bob"}], "user", {})
+
+    (query,) = queries_containing(mock_graph, "UNWIND $rows AS row")
+    assert "MERGE (source:unknown" in query.args[0]
+    assert "MERGE (destination:unknown" in query.args[0]
+
+
+def test_delete_entities_maps_results_to_inputs(config, embedding_model, mock_graph):
+    memory_graph = MemoryGraph(config, embedding_model)
+    mock_graph.query.side_effect = make_query(
+        {
+            "[r:likes]": lambda params: [
+                {
+                    "index": row["index"],
+                    "source": row["source_name"],
+                    "target": row["dest_name"],
+                    "relationship": "likes",
+                }
+                for row in params["rows"]
+                if row["dest_name"] != "pasta"
+            ],
+        }
+    )
+    to_be_deleted = [
+        {"source": "alice", "relationship": "likes", "destination": "pizza"},
+        {"source": "alice", "relationship": "lives_in", "destination": "paris"},
+        {"source": "bob", "relationship": "likes", "destination": "pasta"},
+        {"source": "bob", "relationship": "likes", "destination": "pizza"},
+    ]
+
+    results = memory_graph._delete_entities(to_be_deleted, "user")
+
+    assert results == [
+        [{"source": "alice", "target": "pizza", "relationship": "likes"}],
+        [],
+        [],
+        [{"source": "bob", "target": "pizza", "relationship": "likes"}],
+    ]
+    # One query per relationship type
+    assert len(queries_containing(mock_graph, "DELETE r")) == 2
+    (likes_query,) = queries_containing(mock_graph, "[r:likes]")
+    assert [row["index"] for row in likes_query.kwargs["params"]["rows"]] == [0, 2, 3]
+
+
+def test_delete_entities_without_entities(config, embedding_model, mock_graph):
+    memory_graph = MemoryGraph(config, embedding_model)
+    mock_graph.query.reset_mock()
+
+    assert memory_graph._delete_entities([], "user") == []
+    mock_graph.query.assert_not_called()
+
+
+def test_add_without_entities_skips_llm_calls(config, embedding_model, mock_graph):
+    memory_graph = MemoryGraph(config, embedding_model)
+    memory_graph._retrieve_nodes_from_data = Mock(return_value={})
+    memory_graph._establish_nodes_relations_from_data = Mock()
+    mock_graph.query.reset_mock()
+
+    result = memory_graph.add("Hello there", {"user_id": "user"})
+
+    assert result == {"deleted_entities": [], "added_entities": []}
+    memory_graph._establish_nodes_relations_from_data.assert_not_called()
+    mock_graph.query.assert_not_called()
+
+
+def test_add_without_entities_with_custom_prompt(config, embedding_model, mock_graph):
+    config.graph_store.custom_prompt = "Only extract food preferences"
+    memory_graph = MemoryGraph(config, embedding_model)
+    memory_graph._retrieve_nodes_from_data = Mock(return_value={})
+    memory_graph._establish_nodes_relations_from_data = Mock(return_value=[])
+
+    memory_graph.add("Hello there", {"user_id": "user"})
+
+    # A custom prompt may extract relations without entities
+    memory_graph._establish_nodes_relations_from_data.assert_called_once()
+
+
+@pytest.mark.parametrize("search_output, deletes", [([], False), ([{"source": "alice"}], True)])
+def test_add_only_asks_for_deletions_with_existing_relations(
+    config, embedding_model, mock_graph, search_output, deletes
+):
+    memory_graph = MemoryGraph(config, embedding_model)
+    memory_graph._retrieve_nodes_from_data = Mock(return_value={"alice": "person"})
+    memory_graph._establish_nodes_relations_from_data = Mock(return_value=[])
+    memory_graph._search_graph_db = Mock(return_value=search_output)
+    memory_graph._get_delete_entities_from_search_output = Mock(return_value=[])
+
+    memory_graph.add("Alice likes pizza", {"user_id": "user"})
+
+    assert memory_graph._get_delete_entities_from_search_output.called == deletes
+
+
+@pytest.mark.neo4j
+@pytest.mark.skipif(not os.environ.get("NEO4J_URL"), reason="Needs a Neo4j server, set NEO4J_URL")
+class TestMemoryGraphWithNeo4j:
+    """Run the generated Cypher against a real server, for example `neo4j:5.26` from docker."""
+
+    EMBEDDINGS = {"alice": [1, 0, 0], "pizza": [0, 1, 0], "paris": [0, 0, 1]}
+
+    @pytest.fixture
+    def memory_graph(self, config, embedding_model):
+        config.graph_store.config.url = os.environ["NEO4J_URL"]
+        config.graph_store.config.username = os.environ.get("NEO4J_USERNAME", "neo4j")
+        config.graph_store.config.password = os.environ.get("NEO4J_PASSWORD", "password")
+        embedding_model.embed_many.side_effect = lambda texts: [self.EMBEDDINGS[text] for text in texts]
+        with patch("mem0.memory.graph_memory.LlmFactory"), patch("mem0.memory.graph_memory.EmbedderFactory"):
+            memory_graph = MemoryGraph(config, embedding_model)
+        filters = {"user_id": f"test-{uuid.uuid4()}"}
+        yield memory_graph, filters
+        memory_graph.delete_all(filters)
+
+    @pytest.mark.parametrize("use_vector_index", [True, False])
+    def test_add_search_and_delete(self, memory_graph, use_vector_index):
+        memory_graph, filters = memory_graph
+        assert memory_graph.use_vector_index
+        memory_graph.use_vector_index = use_vector_index
+        entity_type_map = {"alice": "person", "pizza": "food", "paris": "city"}
+        relations = [
+            {"source": "alice", "relationship": "likes", "destination": "pizza"},
+            {"source": "alice", "relationship": "lives_in", "destination": "paris"},
+        ]
+
+        added = memory_graph._add_entities(relations, filters["user_id"], entity_type_map)
+        assert sorted(relation[0]["target"] for relation in added) == ["paris", "pizza"]
+        memory_graph.graph.query("CALL db.awaitIndexes()")
+        # Adding again finds the existing nodes instead of creating new ones
+        memory_graph._add_entities(relations[:1], filters["user_id"], entity_type_map)
+
+        search_output = memory_graph._search_graph_db(["pizza"], filters)
+        assert [(row["source"], row["relatationship"], row["destination"]) for row in search_output] == [
+            ("alice", "likes", "pizza")
+        ]
+
+        deleted = memory_graph._delete_entities(relations[:1], filters["user_id"])
+        assert deleted == [[{"source": "alice", "target": "pizza", "relationship": "likes"}]]
+        assert memory_graph.get_all(filters) == [{"source": "alice", "relationship": "lives_in", "target": "paris"}]
@@ -0,0 +1,40 @@
+from unittest.mock import patch
+
+import pytest
+
+import mem0
+
+
+@pytest.fixture(autouse=True)
+def clear_lazy_attributes():
+    for name in mem0.__all__:
+        mem0.__dict__.pop(name, None)
+    yield
+    for name in mem0.__all__:
+        mem0.__dict__.pop(name, None)
+
+
+def test_lazy_clients_and_memory():
+    from mem0 import AsyncMemoryClient, Memory, MemoryClient
+    from mem0.client.main import AsyncMemoryClient as _AsyncMemoryClient
+    from mem0.client.main import MemoryClient as _MemoryClient
+    from mem0.memory.main import Memory as _Memory
+
+    assert Memory is _Memory
+    assert MemoryClient is _MemoryClient
+    assert AsyncMemoryClient is _AsyncMemoryClient
+    # Resolved attributes are cached on the module
+    assert mem0.__dict__["Memory"] is _Memory
+
+
+def test_lazy_version():
+    with patch("mem0.metadata.version", return_value="1.2.3") as mock_version:
+        assert mem0.__version__ == "1.2.3"
+        assert mem0.__version__ == "1.2.3"
+
+    mock_version.assert_called_once_with("mem0ai")
+
+
+def test_unknown_attribute():
+    with pytest.raises(AttributeError):
+        mem0.does_not_exist
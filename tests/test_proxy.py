@@ -98,4 +98,39 @@ def test_completions_create_with_system_message(mock_memory_client, mock_litellm
 
     call_args = mock_litellm.completion.call_args[1]
     assert call_args["messages"][0]["role"] == "system"
-    assert call_args["messages"][0]["content"] == "You are a helpful assistant."
\ No newline at end of file
+    assert call_args["messages"][0]["content"] == "You are a helpful assistant."
+
+
+def test_completions_create_does_not_modify_messages(mock_memory_client, mock_litellm):
+    completions = Completions(mock_memory_client)
+
+    messages = [
+        {"role": "system", "content": "You are a helpful assistant."},
+        {"role": "user", "content": "Hello, how are you?"},
+    ]
+    mock_memory_client.search.return_value = [{"memory": "Some relevant memory"}]
+    mock_litellm.supports_function_calling.return_value = True
+
+    completions.create(model="gpt-4o-mini", messages=messages, user_id="test_user")
+
+    call_args = mock_litellm.completion.call_args[1]
+    assert "Some relevant memory" in call_args["messages"][-1]["content"]
+    assert messages == [
+        {"role": "system", "content": "You are a helpful assistant."},
+        {"role": "user", "content": "Hello, how are you?"},
+    ]
+
+
+def test_completions_logs_failed_background_add(mock_memory_client, mock_litellm, caplog):
+    completions = Completions(mock_memory_client)
+
+    messages = [{"role": "user", "content": "Hello, how are you?"}]
+    mock_memory_client.search.return_value = []
+    mock_memory_client.add.side_effect = RuntimeError("Add failed")
+    mock_litellm.supports_function_calling.return_value = True
+
+    completions.create(model="gpt-4o-mini", messages=messages, user_id="test_user")
+    completions.close()
+
+    mock_memory_client.add.assert_called_once()
+    assert "Add failed" in caplog.text